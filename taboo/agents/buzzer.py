@@ -1,33 +1,55 @@
 import dspy
 
 from ..player import Buzzer
+from ..llm.registry import get_lm, sibling_lm, total_tokens, usage_scope
+from ..llm.prompt_cache import static_inputs
+from ..llm.hedge import Hedger
+from ..llm.resilience import Resilience
 
 
+@static_inputs("taboo_words")
 class BuzzClue(dspy.Signature):
     """
     Check if the clue is one of the taboo words (or a minor variation, like singular/plural).
     It's ok if the clue has a similar meaning to the taboo word, it just can't be the same word.
     """
-    clue: str = dspy.InputField(description="The clue word or phrase given by the Cluer")
     taboo_words: list[str] = dspy.InputField(description="The taboo words that cannot be used in the clue, or you lose")
+    clue: str = dspy.InputField(description="The clue word or phrase given by the Cluer")
 
     buzz: bool = dspy.OutputField(description="Whether the clue violates the taboo words or not")
     justification: str = dspy.OutputField()
 
 
 class AIBuzzer(Buzzer):
-    def __init__(self, model: str = "gemini/gemini-2.5-flash-lite"):
+    def __init__(
+        self,
+        model: str = "gemini/gemini-2.5-flash-lite",
+        hedger: Hedger | None = None,
+        resilience: Resilience | None = None,
+    ):
         super().__init__()
-        self.lm = dspy.LM(model=model, max_tokens=2_000, temperature=1.0)
+        self.resilience = resilience
+        self.lm = get_lm(model, temperature=1.0, max_tokens=2_000)
         self.buzz_clue = dspy.Predict(BuzzClue)
-        self.cache = {}
+        # Optional request hedging: a buzz ends the round
+        self.hedger = hedger
+        # Keyed by (taboo words, clue), so entries stay valid when the buzzer is reused across rounds
+        self.cache: dict[tuple[tuple[str, ...], str], str | None] = {}
 
     async def _violates(self, text: str) -> str | None:
-        if text in self.cache:
-            return self.cache[text]
+        key = (tuple(self.game.taboo_words), text)  # type: ignore[attr-defined]
+        if key in self.cache:
+            return self.cache[key]
         
-        with dspy.context(lm=self.lm):
-            result = await self.buzz_clue.aforward(clue=text, taboo_words=self.game.taboo_words)  # type: ignore[attr-defined]
+        def buzz(model: str):
+            return self.buzz_clue.aforward(clue=text, taboo_words=self.game.taboo_words, lm=sibling_lm(self.lm, model))  # type: ignore[attr-defined]
+
+        def attempt(model: str):
+            return self.hedger.call(lambda: buzz(model)) if self.hedger else buzz(model)
+
+        with self.charge() as charge, usage_scope(self.lm) as usage:
+            result = await self.guarded(attempt, self.lm.model)
+            charge.tokens = total_tokens(usage)
 
-        self.cache[text] = result.justification if result.buzz else None
-        return self.cache[text]
\ No newline at end of file
+        self.cache[key] = result.justification if result.buzz else None
+        return self.cache[key]
\ No newline at end of file
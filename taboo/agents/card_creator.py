@@ -1,8 +1,15 @@
 from __future__ import annotations
+import logging
 
 from pydantic import BaseModel
 import dspy
 
+from ..card_index import CardIndex
+from ..llm.registry import get_lm
+
+
+log = logging.getLogger(__name__)
+
 class CardGenerationError(Exception):
     """Raised when DSPy or LLM fails or returns malformed output."""
     pass
@@ -11,6 +18,10 @@ class InvalidTabooCardError(Exception):
     """Raised when taboo card data is invalid or contains duplicates."""
     pass
 
+class DuplicateCardError(CardGenerationError):
+    """Raised when every generation attempt near-duplicated a card already in the deck."""
+    pass
+
 class CreateCard(dspy.Signature):
     """
     You are creating a game card for the game Taboo. Each card has a target word
@@ -25,6 +36,8 @@ class CreateCard(dspy.Signature):
     that will make the game interesting and challenging. The taboo words should ideally
     be the most obvious clues to the target word, so that the cluer has to be creative.
     """
+    avoid_targets: list[str] = dspy.InputField(description="Target words already used in the deck; choose a different word that is not a variation of any of these")
+
     target: str = dspy.OutputField(description="The target word for the game")
     taboo_words: list[str] = dspy.OutputField(description="A list of taboo words that cannot be used in clues for the target word") 
 
@@ -54,17 +67,37 @@ class CreateTabooWords(dspy.Signature):
 create_taboo_words = dspy.ChainOfThought(CreateTabooWords)
 
 
-lm = dspy.LM(model="gemini/gemini-2.5-pro", max_tokens=20_000, temperature=1.0, cache=False)
+lm = get_lm("gemini/gemini-2.5-pro", temperature=1.0, max_tokens=20_000, cache=False)
 
 class TabooCard(BaseModel):
     target: str
     taboo_words: list[str]
 
     @staticmethod
-    def generate() -> TabooCard:
+    def generate(index: CardIndex | None = None, max_attempts: int = 3) -> TabooCard:
+        """Generate a new card.
+
+        With an index, a card that near-duplicates an indexed one is regenerated
+        (up to max_attempts) and the accepted card is added to the index.
+        """
+        # Recent targets steer the model away from popular repeats up front
+        avoid = index.recent(20) if index is not None else []
+        for _ in range(max_attempts):
+            card = TabooCard._generate(avoid)
+            if index is None:
+                return card
+            duplicates = index.add_if_new(card.target, card.taboo_words)
+            if not duplicates:
+                return card
+            log.info(f"TabooCard: rejected {card.target!r}, near-duplicate of {duplicates[0][0]!r}")
+            avoid = avoid + [card.target] + [target for target, _ in duplicates]
+        raise DuplicateCardError(f"Every generated card duplicated the deck after {max_attempts} attempts.")
+
+    @staticmethod
+    def _generate(avoid_targets: list[str]) -> TabooCard:
         try:
             with dspy.context(lm=lm):
-                result = create_card()
+                result = create_card(avoid_targets=avoid_targets)
                 if not result.target or not result.taboo_words:
                     raise CardGenerationError("DSPy returned malformed card data.")
         except Exception as e:
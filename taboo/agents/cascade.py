@@ -0,0 +1,72 @@
+"""
+Cheap-first model cascade for the cluer and guessers.
+
+Calls go to a cheaper, faster model first and escalate to the agent's strong
+model after N wrong guesses in the round, while plenty of round time is left,
+or (guessers only) when the cheap model reports low confidence in its guess.
+"""
+
+from __future__ import annotations
+import logging
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+import dspy
+from pydantic import BaseModel
+
+from ..llm.registry import get_lm
+
+if TYPE_CHECKING:
+    from taboo.game import Game
+
+
+log = logging.getLogger(__name__)
+
+
+class CascadePolicy(BaseModel):
+    cheap_model: str = "gemini/gemini-2.5-flash-lite"
+    cheap_max_tokens: int = 2_000
+    # Escalate once the round has this many wrong judged guesses
+    escalate_after_wrong: int = 3
+    # Re-ask the strong model when the cheap guess is less confident than this
+    min_confidence: float = 0.5
+    # Escalate while more than this many seconds are left (None disables)
+    escalate_when_remaining_sec_above: Optional[float] = None
+
+
+class Cascade:
+    def __init__(self, policy: CascadePolicy, strong: dspy.LM, owner: str):
+        self.policy = policy
+        self.cheap = get_lm(policy.cheap_model, temperature=1.0, max_tokens=policy.cheap_max_tokens)
+        self.strong = strong
+        self.owner = owner
+        self.decisions: Counter[str] = Counter()
+
+    def choose(self, game: 'Game') -> dspy.LM:
+        """Pick the model for the next call."""
+        wrong = sum(1 for e in game.history() if e.role == "judge" and not e.is_correct)
+        threshold = self.policy.escalate_when_remaining_sec_above
+        if wrong >= self.policy.escalate_after_wrong:
+            return self._decide(self.strong, f"{wrong} wrong guesses")
+        if threshold is not None and game.remaining_sec() > threshold:
+            return self._decide(self.strong, "round time remaining")
+        return self._decide(self.cheap, "default")
+
+    def confident(self, confidence: Any) -> bool:
+        """Whether a cheap answer is confident enough to keep; logs the escalation if not."""
+        try:
+            ok = float(confidence) >= self.policy.min_confidence
+        except (TypeError, ValueError):
+            ok = False
+        if not ok:
+            self._decide(self.strong, f"low confidence ({confidence})")
+        return ok
+
+    def _decide(self, lm: dspy.LM, reason: str) -> dspy.LM:
+        tier = "strong" if lm is self.strong else "cheap"
+        self.decisions[tier] += 1
+        log.info("cascade %s: %s model %s (%s)", self.owner, tier, lm.model, reason)
+        return lm
+
+    def stats(self) -> Dict[str, int]:
+        return {"cheap": self.decisions["cheap"], "strong": self.decisions["strong"]}
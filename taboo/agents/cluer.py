@@ -1,40 +1,61 @@
 import dspy
-import asyncio
 
-from ..player import Cluer
-from ..types import ClueEvent, Event
+from ..player import Cluer, CluePacing
+from ..types import Event
+from ..llm.registry import get_lm, sibling_lm, total_tokens, usage_scope
+from ..llm.prompt_cache import static_inputs
+from ..llm.resilience import Resilience
+from ..llm.streaming import StreamedCall, StreamStats
+from .cascade import Cascade, CascadePolicy
 
 
+@static_inputs("target", "taboo_words")
 class GenerateClue(dspy.Signature):
     target: str = dspy.InputField(description="The target word we want the players to guess")
     taboo_words: list[str] = dspy.InputField(description="The taboo words that cannot be used in the clue, or you lose")
+    # Per-call fields go last, after the declared static inputs
     history: list[Event] = dspy.InputField(description="The history of the game so far, including previous clues, buzzes, guesses, and judgments")
 
     clue: str = dspy.OutputField(description="A single word or short phrase that is a clue to the target word, without using any of the taboo words")
 
 
 class AICluer(Cluer):
-    def __init__(self, model: str = "gemini/gemini-2.5-flash"):
-        super().__init__()
-        self.lm = dspy.LM(model=model, max_tokens=20_000, temperature=1.0)
+    def __init__(
+        self,
+        model: str = "gemini/gemini-2.5-flash",
+        stream: bool = False,
+        cascade: CascadePolicy | None = None,
+        pacing: CluePacing | None = None,
+        resilience: Resilience | None = None,
+    ):
+        super().__init__(pacing=pacing)
+        self.resilience = resilience
+        self.lm = get_lm(model, temperature=1.0, max_tokens=20_000)
+        # Cheap-first cascade: escalates on wrong guesses or remaining round time (no confidence signal)
+        self.cascade = Cascade(cascade, strong=self.lm, owner="cluer") if cascade else None
         self.generate_clue = dspy.Predict(GenerateClue)
+        # Publish the clue as soon as its field is streamed, before the completion ends
+        self.stream = stream
+        self.stream_stats = StreamStats()
 
     async def next_clue(self):
-        with dspy.context(lm=self.lm):
-            coro = self.generate_clue.aforward(
-                target=self.game.target,  # type: ignore[attr-defined]
-                taboo_words=self.game.taboo_words,  # type: ignore[attr-defined]
-                history=self.game.history(),  # type: ignore[attr-defined]
-                lm=self.lm)
-            result = await self.run(coro)
+        lm = self.cascade.choose(self.game) if self.cascade else self.lm
+        inputs = dict(
+            target=self.game.target,  # type: ignore[attr-defined]
+            taboo_words=self.game.taboo_words,  # type: ignore[attr-defined]
+            history=self.game.history())  # type: ignore[attr-defined]
+        if self.stream:
+            charge = self.charge()
+            with usage_scope(lm) as usage:
+                call = StreamedCall(self.generate_clue, "clue", stats=self.stream_stats, lm=lm, **inputs)
+                self.spawn(call.drive())
+            self.spawn(call.settle(charge, usage))
+            return await self.run(call.field())
+
+        with self.charge() as charge, usage_scope(lm) as usage:
+            result = await self.guarded(
+                lambda model: self.generate_clue.aforward(**inputs, lm=sibling_lm(lm, model)), lm.model)
+            charge.tokens = total_tokens(usage)
         return result.clue
-    
-    async def play(self):
-        while not self.game.is_over():
-            try:
-                clue = await self.next_clue()
-            except asyncio.CancelledError:
-                return
-            await self.announce(ClueEvent(role="cluer", clue=clue))
-
-    # end() is inherited from Player and will cancel/await tracked tasks
+
+    # play() (optionally paced) and end() are inherited from Cluer/Player
@@ -1,35 +1,101 @@
+from typing import Literal
+
 import dspy
 
 from ..player import Guesser, Guess
+from ..llm.registry import get_lm, sibling_lm, total_tokens, usage_scope
+from ..llm.prompt_cache import static_inputs
+from ..llm.resilience import Resilience
+from .cascade import Cascade, CascadePolicy
+from ..llm.streaming import StreamedCall, StreamStats
+from ..types import RationaleEvent
+
+
+PERSONALITIES = ('friendly', 'sarcastic', 'enthusiastic', 'thoughtful', 'mischievous')
 
 
+@static_inputs("player_id", "player_personality")
 class GuessWord(dspy.Signature):
     """
     You are playing a game of Taboo. Your goal is to guess the target word based on the clues given by the Cluer.
     """
 
-    history: list = dspy.InputField(description="The history of the game so far, including previous clues, buzzes, guesses, and judgments")
     player_id: str = dspy.InputField(description="The ID of the player making the guess")
     player_personality: str | None = dspy.InputField(description="Optional personality or background information about the player making the guess")
+    rejected_guesses: list[str] = dspy.InputField(description="Guesses already judged wrong this round; do not repeat them or minor variations of them")
+    # Per-call fields go last, after the declared static inputs
+    history: list = dspy.InputField(description="The history of the game so far, including previous clues, buzzes, guesses, and judgments")
 
     guess: str = dspy.OutputField(description="The guessed word")
     rationale: str | None = dspy.OutputField(description="Optional rationale for the guess")
 
 
+# Cascade mode asks the cheap model how sure it is, to decide whether to escalate
+GuessWordWithConfidence = static_inputs("player_id", "player_personality")(GuessWord.append(
+    "confidence",
+    dspy.OutputField(description="How confident you are that the guess is the target word, from 0.0 to 1.0"),
+    type_=float,
+))
+
+
 class AIGuesser(Guesser):
-    def __init__(self, player_id: str, personality: str | None = None, model: str = "gemini/gemini-2.5-flash"):
-        super().__init__(player_id)
+    def __init__(
+        self,
+        player_id: str,
+        personality: str | None = None,
+        model: str = "gemini/gemini-2.5-flash",
+        stream: bool = False,
+        cascade: CascadePolicy | None = None,
+        duplicate_policy: Literal["publish", "suppress"] = "publish",
+        resilience: Resilience | None = None,
+    ):
+        super().__init__(player_id, duplicate_policy=duplicate_policy)
+        self.resilience = resilience
         self.player_personality = personality
-        self.lm = dspy.LM(model=model, max_tokens=20_000, temperature=1.0)
-        self.guess_fn = dspy.Predict(GuessWord)
+        self.lm = get_lm(model, temperature=1.0, max_tokens=20_000)
+        self.cascade = Cascade(cascade, strong=self.lm, owner=player_id) if cascade else None
+        self.guess_fn = dspy.Predict(GuessWordWithConfidence if cascade else GuessWord)
+        # Publish the guess as soon as it is streamed; the rationale follows as a RationaleEvent
+        self.stream = stream
+        self.stream_stats = StreamStats()
 
     async def next_guess(self) -> Guess:
-        with dspy.context(lm=self.lm):
-            coro = self.guess_fn.aforward(
-                history=self.game.history(),  # type: ignore[attr-defined]
-                player_id=self.player_id,
-                player_personality=self.player_personality
-            )
-            result = await self.run(coro)
+        inputs = dict(
+            player_id=self.player_id,
+            player_personality=self.player_personality,
+            rejected_guesses=self.game.guess_index.rejected(),  # type: ignore[attr-defined]
+            history=self.game.history(),  # type: ignore[attr-defined]
+        )
+        lm = self.cascade.choose(self.game) if self.cascade else self.lm
+        if self.stream:
+            return await self._stream_guess(inputs, lm)
+
+        with self.charge() as charge, usage_scope(lm) as usage:
+            def ask(base: dspy.LM):
+                return lambda model: self.guess_fn.aforward(**inputs, lm=sibling_lm(base, model))
+
+            result = await self.guarded(ask(lm), lm.model)
+            if self.cascade and lm is not self.lm and not self.cascade.confident(result.confidence):
+                result = await self.guarded(ask(self.lm), self.lm.model)
+            charge.tokens = total_tokens(usage)
         return Guess(guess=result.guess, rationale=result.rationale)
+
+    async def _stream_guess(self, inputs: dict, lm: dspy.LM) -> Guess:
+        # Confidence arrives after the guess is published, so streamed guesses never re-ask
+        charge = self.charge()
+        with usage_scope(lm) as usage:
+            call = StreamedCall(self.guess_fn, "guess", stats=self.stream_stats, **inputs)
+            self.spawn(call.drive())
+        guess = await self.run(call.field())
+        self.spawn(self._attach_rationale(call, guess))
+        self.spawn(call.settle(charge, usage))
+        return Guess(guess=guess)
+
+    async def _attach_rationale(self, call: StreamedCall, guess: str):
+        try:
+            prediction = await call.prediction()
+        except Exception:
+            return
+        if guess.strip() and prediction.rationale:
+            await self.announce(RationaleEvent(role="rationale", player_id=self.player_id, guess=guess, rationale=prediction.rationale))  # type: ignore[arg-type]
     # end() inherited from Player handles pending task cancellation
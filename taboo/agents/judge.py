@@ -1,8 +1,13 @@
 import dspy
 
 from ..player import Judge
+from ..llm.registry import get_lm, sibling_lm, total_tokens, usage_scope
+from ..llm.prompt_cache import static_inputs
+from ..llm.hedge import Hedger
+from ..llm.resilience import Resilience
 
 
+@static_inputs("target")
 class CheckGuess(dspy.Signature):
     """
     Check if the guess matches the target word.
@@ -15,21 +20,39 @@ class CheckGuess(dspy.Signature):
     justification: str = dspy.OutputField(description="A brief explanation of why the guess is correct or not")
 
 class AIJudge(Judge):
-    def __init__(self, model: str = "gemini/gemini-2.5-flash-lite"):
+    def __init__(
+        self,
+        model: str = "gemini/gemini-2.5-flash-lite",
+        hedger: Hedger | None = None,
+        resilience: Resilience | None = None,
+    ):
         super().__init__()
-        self.lm = dspy.LM(model=model, max_tokens=2_000, temperature=1.0)
+        self.resilience = resilience
+        self.lm = get_lm(model, temperature=1.0, max_tokens=2_000)
         self.checker = dspy.Predict(CheckGuess)
-        self.cache = {}
+        # Optional request hedging: verdicts gate the end of the round
+        self.hedger = hedger
+        # Verdicts keyed by (target, guess), so they stay valid when the judge is reused across rounds
+        self.cache: dict[tuple[str, str], bool] = {}
 
     async def check_guess(self, guess: str) -> bool:
-        if guess in self.cache:
-            return self.cache[guess]
+        key = (self.game.target, guess)  # type: ignore[attr-defined]
+        if key in self.cache:
+            return self.cache[key]
 
-        with dspy.context(lm=self.lm):
-            result = await self.checker.aforward(
+        def check(model: str):
+            return self.checker.aforward(
                 target=self.game.target,  # type: ignore[attr-defined]
-                guess=guess
+                guess=guess,
+                lm=sibling_lm(self.lm, model),
             )
-            self.cache[guess] = result.is_correct
 
-        return self.cache[guess]
+        def attempt(model: str):
+            return self.hedger.call(lambda: check(model)) if self.hedger else check(model)
+
+        with self.charge() as charge, usage_scope(self.lm) as usage:
+            result = await self.guarded(attempt, self.lm.model)
+            charge.tokens = total_tokens(usage)
+            self.cache[key] = result.is_correct
+
+        return self.cache[key]
@@ -0,0 +1,107 @@
+"""
+Round-level token budget shared by every agent.
+
+Each agent LLM call reserves an estimate before it starts and settles the
+actual token count when it finishes. When the remaining budget runs low,
+low-priority work (extra guessers) is throttled first; once the budget is
+exhausted the game ends the round with reason "budget".
+"""
+
+from __future__ import annotations
+import asyncio
+from collections import Counter
+from typing import Any, Dict, Literal, Optional
+
+
+Priority = Literal["high", "low"]
+
+
+class BudgetExceeded(Exception):
+    """Raised when a call cannot be reserved because the round budget is spent."""
+
+
+class BudgetThrottled(BudgetExceeded):
+    """Raised for low-priority calls while the remaining budget is below the low-water mark."""
+
+
+class Charge:
+    """One reserved call. Set ``tokens`` (or call ``settle``) with the actual usage."""
+
+    def __init__(self, budget: Optional['RoundBudget'], agent: str, reserved: int):
+        self.budget = budget
+        self.agent = agent
+        self.reserved = reserved
+        self.tokens = 0
+        self.settled = False
+
+    def settle(self, tokens: int | None = None):
+        if self.settled:
+            return
+        self.settled = True
+        if tokens is not None:
+            self.tokens = tokens
+        if self.budget is not None:
+            self.budget._settle(self)
+
+    def __enter__(self) -> 'Charge':
+        return self
+
+    def __exit__(self, *exc: Any):
+        self.settle()
+
+
+class RoundBudget:
+    def __init__(self, max_tokens: int | None = None, estimate_tokens: int = 2_000, low_water: float = 0.25):
+        # max_tokens=None only records spend, it never throttles or ends the round
+        self.max_tokens = max_tokens
+        self.estimate_tokens = estimate_tokens
+        self.low_water = low_water
+        self.spent = 0
+        self.reserved = 0
+        self.per_agent: Counter[str] = Counter()
+        self.calls: Counter[str] = Counter()
+        self.throttled: Counter[str] = Counter()
+        self.exhausted = asyncio.Event()
+
+    def remaining(self) -> float:
+        if self.max_tokens is None:
+            return float("inf")
+        return self.max_tokens - self.spent - self.reserved
+
+    def _estimate(self, agent: str) -> int:
+        # Running mean of this agent's settled calls, falling back to the default estimate
+        if self.calls[agent]:
+            return max(1, self.per_agent[agent] // self.calls[agent])
+        return self.estimate_tokens
+
+    def charge(self, agent: str, priority: Priority = "high") -> Charge:
+        """Reserve tokens for one call by ``agent``."""
+        estimate = self._estimate(agent)
+        if self.max_tokens is not None:
+            if self.spent >= self.max_tokens:
+                self.exhausted.set()
+                raise BudgetExceeded(f"Round budget of {self.max_tokens} tokens is spent.")
+            # High-priority calls may over-commit the reservations; low-priority ones keep a margin
+            available = self.remaining()
+            if priority == "low" and available - estimate < self.low_water * self.max_tokens:
+                self.throttled[agent] += 1
+                raise BudgetThrottled(f"{agent} throttled: {available} tokens left.")
+        self.reserved += estimate
+        return Charge(self, agent, estimate)
+
+    def _settle(self, charge: Charge):
+        self.reserved -= charge.reserved
+        self.spent += charge.tokens
+        self.per_agent[charge.agent] += charge.tokens
+        self.calls[charge.agent] += 1
+        if self.max_tokens is not None and self.spent >= self.max_tokens:
+            self.exhausted.set()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_tokens": self.max_tokens,
+            "spent": self.spent,
+            "per_agent": {agent: {"tokens": self.per_agent[agent], "calls": self.calls[agent]} for agent in self.calls},
+            "throttled": dict(self.throttled),
+            "exhausted": self.exhausted.is_set(),
+        }
@@ -0,0 +1,155 @@
+"""
+Near-duplicate index over Taboo cards.
+
+Each card is reduced to a MinHash signature over character trigrams of its
+target and taboo words (normalized like guesses, so "Apples" and "apple"
+agree). Locality-sensitive hashing splits the signature into bands; cards
+sharing any band are candidates, and only candidates are compared, so a lookup
+touches a handful of cards rather than the whole deck. Same-target cards are
+always duplicates.
+
+Storage is flat ``array`` buffers rather than per-card objects: signatures in
+one array and, per band, sorted (key, card) arrays searched with bisect, plus
+a small dict of recent inserts that is merged in batches. 100k cards take a
+few tens of MB.
+"""
+
+from __future__ import annotations
+import hashlib
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, List, Sequence, Tuple
+
+from .guess_index import guess_key
+
+
+def card_shingles(target: str, taboo_words: Sequence[str], n: int = 3) -> set[str]:
+    """Character n-grams of the target (tagged, so it weighs apart from the taboo words) and taboo words."""
+    shingles: set[str] = set()
+    for tag, word in [("t", target), *(("w", w) for w in taboo_words)]:
+        padded = f" {guess_key(word)} "
+        shingles.update(tag + padded[i:i + n] for i in range(max(1, len(padded) - n + 1)))
+    return shingles
+
+
+class _Band:
+    """One LSH band: sorted parallel (key, card) arrays plus recent inserts awaiting a merge."""
+
+    def __init__(self, merge_every: int):
+        self.keys = array("q")
+        self.ids = array("I")
+        self.pending: Dict[int, List[int]] = {}
+        self.merge_every = merge_every
+
+    def add(self, key: int, card: int):
+        self.pending.setdefault(key, []).append(card)
+        # Merge batches grow with the band, keeping merges amortized O(log n) per insert
+        if len(self.pending) >= max(self.merge_every, len(self.keys) // 8):
+            self.merge()
+
+    def get(self, key: int) -> List[int]:
+        lo, hi = bisect_left(self.keys, key), bisect_right(self.keys, key)
+        return list(self.ids[lo:hi]) + self.pending.get(key, [])
+
+    def merge(self):
+        pairs = list(zip(self.keys, self.ids))
+        pairs.extend((k, c) for k, cards in self.pending.items() for c in cards)
+        pairs.sort()
+        self.keys = array("q", (k for k, _ in pairs))
+        self.ids = array("I", (c for _, c in pairs))
+        self.pending.clear()
+
+    def nbytes(self) -> int:
+        return self.keys.itemsize * len(self.keys) + self.ids.itemsize * len(self.ids)
+
+
+class CardIndex:
+    def __init__(self, threshold: float = 0.6, num_perm: int = 32, bands: int = 8, merge_every: int = 4_096):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands.")
+        # Estimated Jaccard similarity at or above which two cards are near-duplicates
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.rows = num_perm // bands
+        self._bands = [_Band(merge_every) for _ in range(bands)]
+        self._signatures = array("I")
+        self._targets: List[str] = []
+        self._by_target: Dict[str, int] = {}
+        self.lookups = 0
+        self.candidates = 0
+        self.rejected = 0
+
+    def __len__(self) -> int:
+        return len(self._targets)
+
+    def recent(self, n: int) -> List[str]:
+        """Targets of the last ``n`` indexed cards."""
+        return self._targets[-n:] if n > 0 else []
+
+    def signature(self, target: str, taboo_words: Sequence[str]) -> array:
+        # One extendable-output hash per shingle yields all num_perm 32-bit hash functions at once
+        rows = [array("I", hashlib.shake_128(s.encode()).digest(4 * self.num_perm))
+                for s in card_shingles(target, taboo_words)]
+        return array("I", map(min, zip(*rows)))
+
+    def _band_keys(self, sig: array) -> List[int]:
+        r = self.rows
+        return [hash((i, tuple(sig[i * r:(i + 1) * r]))) for i in range(len(self._bands))]
+
+    def _similarity(self, sig: array, card: int) -> float:
+        other = self._signatures[card * self.num_perm:(card + 1) * self.num_perm]
+        return sum(1 for x, y in zip(sig, other) if x == y) / self.num_perm
+
+    def _query(self, target: str, sig: array) -> List[Tuple[str, float]]:
+        self.lookups += 1
+        matches: Dict[int, float] = {}
+        same = self._by_target.get(guess_key(target))
+        if same is not None:
+            matches[same] = 1.0
+        seen: set[int] = set(matches)
+        for band, key in zip(self._bands, self._band_keys(sig)):
+            for card in band.get(key):
+                if card in seen:
+                    continue
+                seen.add(card)
+                self.candidates += 1
+                score = self._similarity(sig, card)
+                if score >= self.threshold:
+                    matches[card] = score
+        return sorted(((self._targets[c], s) for c, s in matches.items()), key=lambda m: -m[1])
+
+    def query(self, target: str, taboo_words: Sequence[str]) -> List[Tuple[str, float]]:
+        """Indexed near-duplicates of the card as (target, estimated similarity), most similar first."""
+        return self._query(target, self.signature(target, taboo_words))
+
+    def add(self, target: str, taboo_words: Sequence[str]) -> int:
+        """Index a card unconditionally; returns its position."""
+        return self._add(target, self.signature(target, taboo_words))
+
+    def _add(self, target: str, sig: array) -> int:
+        card = len(self._targets)
+        self._targets.append(target)
+        self._by_target.setdefault(guess_key(target), card)
+        self._signatures.extend(sig)
+        for band, key in zip(self._bands, self._band_keys(sig)):
+            band.add(key, card)
+        return card
+
+    def add_if_new(self, target: str, taboo_words: Sequence[str]) -> List[Tuple[str, float]]:
+        """Index the card unless it near-duplicates an indexed one; returns the duplicates found (empty if added)."""
+        sig = self.signature(target, taboo_words)
+        matches = self._query(target, sig)
+        if matches:
+            self.rejected += 1
+        else:
+            self._add(target, sig)
+        return matches
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "cards": len(self),
+            "lookups": self.lookups,
+            "rejected": self.rejected,
+            "candidates_per_lookup": self.candidates / self.lookups if self.lookups else 0.0,
+            "index_bytes": self._signatures.itemsize * len(self._signatures) + sum(b.nbytes() for b in self._bands),
+        }
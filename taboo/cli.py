@@ -1,8 +1,10 @@
 from __future__ import annotations
 import asyncio
+import json
 import logging
 import warnings
-from typing import Optional
+from pathlib import Path
+from typing import List, Optional
 import itertools
 import random
 
@@ -10,13 +12,26 @@ import typer
 
 
 from .agents import AIBuzzer, AICluer, AIJudge, AIGuesser
-from .agents.card_creator import TabooCard
+from .agents import guesser
+from .agents.card_creator import CardGenerationError, TabooCard
+from .card_index import CardIndex
+from .agents.cascade import CascadePolicy
+from .event_log import EventLog
+from .evaluate import (
+    EvalConfig, build_players, evaluate, fake_unsupported, format_table, load_deck, pacing_report, summarize,
+)
 from .game import Game
+from .session import Session
+from .simclock import run_simulated
+from .player import CluePacing
+from .llm.hedge import Hedger
+from .llm.prompt_cache import prompt_cache
+from .llm.resilience import Resilience
 from .types import Event
 
 app = typer.Typer(add_completion=False, no_args_is_help=True, help="Play an AI-driven Taboo demo.")
 
-PERSONALITIES = ['friendly', 'sarcastic', 'enthusiastic', 'thoughtful', 'mischievous']
+PERSONALITIES = list(guesser.PERSONALITIES)
 random.shuffle(PERSONALITIES)
 personalities = itertools.cycle(PERSONALITIES)
 
@@ -31,6 +46,8 @@ def _format_event(ev: Event) -> str:
         who = ev.player_id
         base = f"[guesser {who}] {ev.guess}"
         return base + (f" — {ev.rationale}" if ev.rationale else "")
+    if r == "rationale":
+        return f"[guesser {ev.player_id}] ↳ {ev.rationale}"
     if r == "judge":
         verdict = "CORRECT" if ev.is_correct else "INCORRECT"
         by = f" {ev.guess} by {ev.by}"
@@ -38,6 +55,8 @@ def _format_event(ev: Event) -> str:
     if r == "system":
         if ev.event == "timeout":
             return "[system] timeout"
+        if ev.event == "budget":
+            return "[system] token budget spent"
         if ev.event == "end":
             reason = ev.reason or "unknown"
             win = ev.winner
@@ -50,6 +69,14 @@ def play(
     target: Optional[str] = typer.Option(None, help="Target word. If omitted, a full card is auto-generated."),
     guessers: int = typer.Option(3, min=1, help="Number of AI guessers"),
     duration: int = typer.Option(60, min=5, help="Round duration in seconds"),
+    hedge: bool = typer.Option(False, help="Hedge slow judge/buzzer calls to cut tail latency"),
+    stream: bool = typer.Option(False, help="Publish clues and guesses as soon as they are streamed"),
+    cascade: bool = typer.Option(False, help="Try a cheaper model first; escalate on wrong or low-confidence guesses"),
+    suppress_duplicates: bool = typer.Option(False, help="Drop guesses that repeat an already-rejected guess"),
+    pace: bool = typer.Option(False, help="Wait for guessers to react before the next clue"),
+    budget_tokens: Optional[int] = typer.Option(None, min=1, help="End the round once agents spend this many tokens"),
+    resilient: bool = typer.Option(False, help="Deadlines, retries and circuit breakers (with model fallback) on LLM calls"),
+    max_resident_events: Optional[int] = typer.Option(None, min=4, help="Keep about this many events in memory; archive older ones to disk"),
 ):
     """Run an AI vs AI Taboo round and print the transcript."""
     logging.basicConfig(level=logging.WARNING, format="%(asctime)s %(levelname)-8s %(name)s: %(message)s")
@@ -69,18 +96,29 @@ def play(
 
     typer.echo(f"Card: target={card.target}, taboo_words={card.taboo_words}")
 
+    policy = CascadePolicy() if cascade else None
+    # One shared layer, so each model's breaker sees every agent's calls
+    resilience = Resilience(fallbacks={
+        "gemini/gemini-2.5-flash": "gemini/gemini-2.5-flash-lite",
+        "gemini/gemini-2.5-flash-lite": "gemini/gemini-2.5-flash",
+    }) if resilient else None
     players = [
-        AICluer(), 
-        AIBuzzer(), 
-        AIJudge()
+        AICluer(stream=stream, cascade=policy, pacing=CluePacing() if pace else None, resilience=resilience), 
+        AIBuzzer(hedger=Hedger() if hedge else None, resilience=resilience), 
+        AIJudge(hedger=Hedger() if hedge else None, resilience=resilience)
     ]
     
     for i in range(guessers):
         personality = next(personalities)
         pid = f"p{i+1}-{personality}"
-        players.append(AIGuesser(player_id=pid, personality=personality))
+        players.append(AIGuesser(player_id=pid, personality=personality, stream=stream, cascade=policy,
+                                  duplicate_policy="suppress" if suppress_duplicates else "publish",
+                                  resilience=resilience))
 
-    game = Game(target=card.target, taboo_words=card.taboo_words, players=players, duration_sec=duration)
+    # Four segments stay resident; older ones are archived to a temporary directory
+    event_log = EventLog(segment_size=max_resident_events // 4, hot_segments=4) if max_resident_events else None
+    game = Game(target=card.target, taboo_words=card.taboo_words, players=players, duration_sec=duration,
+                budget_tokens=budget_tokens, event_log=event_log)
 
     async def _run():
         async def render_stream() -> str:
@@ -94,8 +132,139 @@ def play(
             return winner or ""
 
         render_task = asyncio.create_task(render_stream())
-        await game.play()
+        result = await game.play()
         w = await render_task
         typer.echo(f"\nRound finished. Winner: {w or 'none'}")
+        typer.echo(f"Clues: {result['clues']}")
+        spend = result["spend"]
+        typer.echo(f"Tokens: {spend['spent']}" + "".join(f", {a}={s['tokens']}" for a, s in spend["per_agent"].items()))
+        dup = result["guesses"]
+        typer.echo(f"Duplicate guesses: {dup['duplicates'] + dup['suppressed']} ({dup['duplicate_rate']:.0%})")
+        if resilience:
+            outcomes = {k: v for k, v in resilience.stats().items() if k != "breakers" and v}
+            typer.echo("LLM calls: " + ", ".join(f"{k}={v}" for k, v in outcomes.items()))
+        if event_log:
+            mem = result["memory"]
+            typer.echo(f"Events: {mem['events']} ({mem['resident_events']} resident, {mem['resident_bytes']} bytes; "
+                       f"{mem['archived_events']} archived)")
+        prompts = prompt_cache().stats()
+        if prompts:
+            typer.echo("Prompt prefixes: " + ", ".join(
+                f"{name} {p['hit_rate']:.0%} reused, {p['cacheable_prefix_ratio']:.0%} cacheable" for name, p in prompts.items()))
 
     asyncio.run(_run())
+
+
+@app.command("eval")
+def eval_deck(
+    deck: Path = typer.Argument(..., exists=True, dir_okay=False, help="Deck file: a JSON array or JSON lines of {target, taboo_words}"),
+    config: List[Path] = typer.Option([], "--config", exists=True, dir_okay=False, help="EvalConfig JSON file; pass two to compare them"),
+    fake: bool = typer.Option(False, help="Use fake LMs on simulated time (no network)"),
+    parallel: int = typer.Option(4, min=1, help="Rounds played at the same time"),
+    seed: Optional[int] = typer.Option(None, help="Seed for fake LMs"),
+    out: Optional[Path] = typer.Option(None, help="Write per-card results as JSON lines"),
+):
+    """Play every card in a deck and print solve rate, speed and cost per configuration."""
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s %(levelname)-8s %(name)s: %(message)s")
+    cards = load_deck(deck)
+    configs = [EvalConfig.model_validate_json(p.read_text()) for p in config] or [EvalConfig()]
+    if len({c.name for c in configs}) != len(configs):
+        raise typer.BadParameter("configurations need distinct names", param_hint="--config")
+    overrides: dict = {"fake": True} if fake else {}
+    if seed is not None:
+        overrides["seed"] = seed
+    configs = [c.model_copy(update=overrides) for c in configs]
+    for c in configs:
+        if unsupported := fake_unsupported(c):
+            raise typer.BadParameter(f"{c.name}: fake players ignore {', '.join(unsupported)}", param_hint="--config")
+
+    summaries = {}
+    rows = []
+    for c in configs:
+        typer.echo(f"Evaluating {c.name} on {len(cards)} cards...", err=True)
+        results = evaluate(c, cards, parallel=parallel)
+        summaries[c.name] = summarize(results)
+        rows.extend({"config": c.name, **r.model_dump()} for r in results)
+
+    typer.echo(format_table(summaries))
+    if out:
+        out.write_text("".join(json.dumps(row) + "\n" for row in rows))
+
+
+@app.command("pacing")
+def compare_pacing(
+    deck: Path = typer.Argument(..., exists=True, dir_okay=False, help="Deck file: a JSON array or JSON lines of {target, taboo_words}"),
+    config: Optional[Path] = typer.Option(None, exists=True, dir_okay=False, help="EvalConfig JSON file for the agents"),
+    fake: bool = typer.Option(False, help="Use fake LMs on simulated time (no network)"),
+    parallel: int = typer.Option(4, min=1, help="Rounds played at the same time"),
+    seed: Optional[int] = typer.Option(None, help="Seed for fake LMs"),
+):
+    """Play a deck under each clue pacing policy; print clues per round and tokens per correct answer."""
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s %(levelname)-8s %(name)s: %(message)s")
+    cfg = EvalConfig.model_validate_json(config.read_text()) if config else EvalConfig()
+    cfg = cfg.model_copy(update={"fake": cfg.fake or fake, **({"seed": seed} if seed is not None else {})})
+    if unsupported := fake_unsupported(cfg):
+        raise typer.BadParameter(f"fake players ignore {', '.join(unsupported)}", param_hint="--config")
+    typer.echo(format_table(pacing_report(cfg, load_deck(deck), parallel=parallel)))
+
+
+@app.command("deck")
+def generate_deck(
+    out: Path = typer.Argument(..., dir_okay=False, help="Deck file (JSON lines); new cards are appended"),
+    cards: int = typer.Option(10, min=1, help="Number of new cards to generate"),
+    threshold: float = typer.Option(0.6, min=0.0, max=1.0, help="Similarity at which a card counts as a near-duplicate"),
+):
+    """Generate cards into a deck, regenerating near-duplicates of cards already in it."""
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s %(levelname)-8s %(name)s: %(message)s")
+    index = CardIndex(threshold=threshold)
+    existing = load_deck(out) if out.exists() else []
+    for card in existing:
+        index.add(card.target, card.taboo_words)
+
+    added = 0
+    with out.open("a") as f:
+        for _ in range(cards):
+            try:
+                card = TabooCard.generate(index=index)
+            except CardGenerationError as e:
+                typer.echo(f"Skipped: {e}", err=True)
+                continue
+            f.write(card.model_dump_json() + "\n")
+            f.flush()
+            added += 1
+            typer.echo(f"{card.target}: {card.taboo_words}")
+
+    stats = index.stats()
+    typer.echo(f"Added {added} cards ({len(existing) + added} in deck), rejected {stats['rejected']} near-duplicates")
+
+
+@app.command("session")
+def play_session(
+    rounds: int = typer.Option(5, min=1, help="Rounds to play"),
+    deck: Optional[Path] = typer.Option(None, exists=True, dir_okay=False, help="Deck file; if omitted, cards are generated"),
+    config: Optional[Path] = typer.Option(None, exists=True, dir_okay=False, help="EvalConfig JSON file for the agents"),
+    fake: bool = typer.Option(False, help="Use fake LMs on simulated time (needs --deck)"),
+    seed: Optional[int] = typer.Option(None, help="Seed for fake LMs"),
+):
+    """Play consecutive rounds with the same agents and keep score."""
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s %(levelname)-8s %(name)s: %(message)s")
+    cfg = EvalConfig.model_validate_json(config.read_text()) if config else EvalConfig()
+    cfg = cfg.model_copy(update={"fake": cfg.fake or fake, **({"seed": seed} if seed is not None else {})})
+    if cfg.fake and deck is None:
+        raise typer.BadParameter("fake sessions need a deck", param_hint="--deck")
+    if unsupported := fake_unsupported(cfg):
+        raise typer.BadParameter(f"fake players ignore {', '.join(unsupported)}", param_hint="--config")
+
+    index = CardIndex()
+    cards = load_deck(deck) if deck else (lambda: TabooCard.generate(index=index))
+    resilience = Resilience(seed=cfg.seed) if cfg.resilient else None
+    session = Session(build_players(cfg, 0, resilience), cards, duration_sec=cfg.duration_sec, budget_tokens=cfg.budget_tokens)
+
+    coro = session.run(rounds)
+    for r in (run_simulated(coro) if cfg.fake else asyncio.run(coro)):
+        gap = f", gap {r.gap_sec:.2f}s" if r.gap_sec is not None else ""
+        typer.echo(f"Round {r.round}: {r.target} -> {r.reason}" + (f" ({r.winner})" if r.winner else "")
+                   + f" in {r.duration_sec:.1f}s{gap}")
+    stats = session.stats()
+    typer.echo("Scores: " + ", ".join(f"{who}={n}" for who, n in stats["scores"].items()))
+    typer.echo(f"Gap between rounds: mean {stats['mean_gap_sec']:.2f}s, max {stats['max_gap_sec']:.2f}s")
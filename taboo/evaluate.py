@@ -0,0 +1,256 @@
+"""
+Offline evaluation: run an agent configuration over a deck of cards.
+
+Every card is played as a full round with bounded parallelism, and per-card
+results are summarised into solve rate, time-to-solve, clues and guesses per
+solve, LLM calls and tokens. Two configurations can be compared side by side.
+
+With ``fake=True`` the rounds use FakeLLM players and run on the virtual
+clock, so a sweep needs no network and finishes in seconds. Fake players
+only model pacing, duplicate suppression, resilience and the budget; a fake
+config that sets models, hedging, streaming or a cascade is rejected. Real models go
+through dspy's on-disk request cache, so re-running a configuration replays
+any identical requests it already recorded.
+"""
+
+from __future__ import annotations
+import asyncio
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from pydantic import BaseModel
+
+from .agents import AIBuzzer, AICluer, AIJudge, AIGuesser
+from .agents.card_creator import TabooCard
+from .agents.cascade import CascadePolicy
+from .agents.guesser import PERSONALITIES
+from .fake import fake_players
+from .game import Game
+from .llm.hedge import Hedger
+from .llm.resilience import Resilience
+from .player import CluePacing, Player
+from .simclock import run_simulated
+
+
+log = logging.getLogger(__name__)
+
+
+class EvalConfig(BaseModel):
+    """One agent configuration to evaluate (load with ``EvalConfig.model_validate_json``)."""
+    name: str = "default"
+    # FakeLLM players on the virtual clock instead of real models
+    fake: bool = False
+    seed: Optional[int] = None
+    guessers: int = 3
+    duration_sec: int = 60
+    cluer_model: str = "gemini/gemini-2.5-flash"
+    guesser_model: str = "gemini/gemini-2.5-flash"
+    judge_model: str = "gemini/gemini-2.5-flash-lite"
+    buzzer_model: str = "gemini/gemini-2.5-flash-lite"
+    hedge: bool = False
+    stream: bool = False
+    cascade: Optional[CascadePolicy] = None
+    pacing: Optional[CluePacing] = None
+    suppress_duplicates: bool = False
+    resilient: bool = False
+    budget_tokens: Optional[int] = None
+
+
+# Real-agent settings that FakeLLM players cannot honour
+FAKE_UNSUPPORTED = ("cluer_model", "guesser_model", "judge_model", "buzzer_model", "hedge", "stream", "cascade")
+
+
+def fake_unsupported(config: EvalConfig) -> List[str]:
+    """Fields of a fake ``config`` set away from their defaults that the fake players would ignore."""
+    if not config.fake:
+        return []
+    return [f for f in FAKE_UNSUPPORTED if getattr(config, f) != EvalConfig.model_fields[f].default]
+
+
+def _check_fake(config: EvalConfig):
+    unsupported = fake_unsupported(config)
+    if unsupported:
+        # Otherwise two configs differing only in these fields would compare as identical
+        raise ValueError(f"config {config.name!r}: fake players ignore {', '.join(unsupported)}; "
+                         "drop these fields or evaluate with real models")
+
+
+class CardResult(BaseModel):
+    target: str
+    reason: str
+    winner: Optional[str] = None
+    solved: bool
+    # Seconds from the start of the round to its end
+    elapsed_sec: float
+    clues: int
+    guesses: int
+    llm_calls: int
+    tokens: int
+    error: Optional[str] = None
+
+
+def load_deck(path: str | Path) -> List[TabooCard]:
+    """Read cards from a JSON array or a JSON-lines file of ``{"target", "taboo_words"}`` objects."""
+    text = Path(path).read_text()
+    if text.lstrip().startswith("["):
+        return [TabooCard.model_validate(c) for c in json.loads(text)]
+    return [TabooCard.model_validate_json(line) for line in text.splitlines() if line.strip()]
+
+
+def build_players(config: EvalConfig, card_no: int, resilience: Optional[Resilience] = None) -> List[Player]:
+    """A fresh set of players for one round of ``config``."""
+    if config.fake:
+        _check_fake(config)
+        seed = None if config.seed is None else config.seed * 100_003 + card_no
+        return fake_players(guessers=config.guessers, seed=seed, resilience=resilience, pacing=config.pacing,
+                            duplicate_policy="suppress" if config.suppress_duplicates else "publish")
+
+    players: List[Player] = [
+        AICluer(model=config.cluer_model, stream=config.stream, cascade=config.cascade, pacing=config.pacing,
+                resilience=resilience),
+        AIBuzzer(model=config.buzzer_model, hedger=Hedger() if config.hedge else None, resilience=resilience),
+        AIJudge(model=config.judge_model, hedger=Hedger() if config.hedge else None, resilience=resilience),
+    ]
+    for i in range(config.guessers):
+        personality = PERSONALITIES[i % len(PERSONALITIES)]
+        players.append(AIGuesser(
+            player_id=f"p{i+1}-{personality}", personality=personality, model=config.guesser_model,
+            stream=config.stream, cascade=config.cascade, resilience=resilience,
+            duplicate_policy="suppress" if config.suppress_duplicates else "publish",
+        ))
+    return players
+
+
+async def play_card(config: EvalConfig, card: TabooCard, card_no: int, resilience: Optional[Resilience] = None) -> CardResult:
+    game = Game(target=card.target, taboo_words=card.taboo_words, players=build_players(config, card_no, resilience),
+                duration_sec=config.duration_sec, budget_tokens=config.budget_tokens)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    try:
+        result = await game.play()
+    except Exception as e:
+        log.exception(f"eval {config.name}: round for {card.target!r} failed")
+        return CardResult(target=card.target, reason="error", solved=False, elapsed_sec=loop.time() - start,
+                          clues=0, guesses=0, llm_calls=0, tokens=0, error=str(e))
+    end = result["events"][-1]
+    spend = result["spend"]
+    return CardResult(
+        target=card.target,
+        reason=end.reason or "unknown",
+        winner=end.winner,
+        solved=end.reason == "correct",
+        elapsed_sec=loop.time() - start,
+        clues=result["clues"],
+        guesses=result["guess_events"],
+        llm_calls=sum(a["calls"] for a in spend["per_agent"].values()),
+        tokens=spend["spent"],
+    )
+
+
+async def evaluate_async(config: EvalConfig, deck: Sequence[TabooCard], parallel: int = 4) -> List[CardResult]:
+    """Play every card in ``deck``, at most ``parallel`` rounds at a time; results follow deck order."""
+    _check_fake(config)
+    limit = asyncio.Semaphore(parallel)
+    # Shared across the run, so breakers see every round's calls
+    resilience = Resilience(seed=config.seed) if config.resilient else None
+
+    async def one(i: int, card: TabooCard) -> CardResult:
+        async with limit:
+            return await play_card(config, card, i, resilience)
+
+    return list(await asyncio.gather(*(one(i, card) for i, card in enumerate(deck))))
+
+
+def evaluate(config: EvalConfig, deck: Sequence[TabooCard], parallel: int = 4) -> List[CardResult]:
+    """Run ``evaluate_async`` to completion; fake configurations run on simulated time."""
+    coro = evaluate_async(config, deck, parallel=parallel)
+    return run_simulated(coro) if config.fake else asyncio.run(coro)
+
+
+def summarize(results: Sequence[CardResult]) -> Dict[str, float]:
+    solved = [r for r in results if r.solved]
+    n, s = len(results), len(solved)
+
+    def per(total: float, count: int) -> float:
+        return total / count if count else float("nan")
+
+    return {
+        "cards": n,
+        "solved": s,
+        "solve_rate": per(s, n),
+        "time_to_solve_sec": per(sum(r.elapsed_sec for r in solved), s),
+        # Per-solve metrics average over solved cards; the cost of failures shows in the per-card ones
+        "clues_per_solve": per(sum(r.clues for r in solved), s),
+        "guesses_per_solve": per(sum(r.guesses for r in solved), s),
+        "llm_calls_per_card": per(sum(r.llm_calls for r in results), n),
+        "tokens_per_card": per(sum(r.tokens for r in results), n),
+        "tokens_per_solve": per(sum(r.tokens for r in solved), s),
+        "errors": sum(1 for r in results if r.error),
+    }
+
+
+# Pacing policies compared by ``pacing_report``
+PACING_POLICIES: Dict[str, Optional[CluePacing]] = {
+    "unpaced": None,
+    "default": CluePacing(),
+    "judged": CluePacing(after_judged=2, interval_sec=None, all_guessers=False),
+    "interval": CluePacing(after_judged=None, interval_sec=5.0, all_guessers=False),
+}
+
+
+def pacing_report(
+    config: EvalConfig,
+    deck: Sequence[TabooCard],
+    policies: Optional[Dict[str, Optional[CluePacing]]] = None,
+    parallel: int = 4,
+) -> Dict[str, Dict[str, float]]:
+    """Play ``deck`` under each pacing policy; reports clues per round and tokens per correct answer."""
+    report: Dict[str, Dict[str, float]] = {}
+    for name, pacing in (policies if policies is not None else PACING_POLICIES).items():
+        results = evaluate(config.model_copy(update={"name": name, "pacing": pacing}), deck, parallel=parallel)
+        solved = sum(1 for r in results if r.solved)
+        tokens = sum(r.tokens for r in results)
+        report[name] = {
+            "cards": len(results),
+            "solved": solved,
+            "solve_rate": solved / len(results) if results else float("nan"),
+            "clues_per_round": sum(r.clues for r in results) / len(results) if results else float("nan"),
+            # Every round's tokens, failed rounds included, per correct answer
+            "tokens_per_correct": tokens / solved if solved else float("nan"),
+        }
+    return report
+
+
+def format_table(summaries: Dict[str, Dict[str, float]]) -> str:
+    """Metrics as rows, one column per configuration; with exactly two, a delta column (second - first)."""
+    names = list(summaries)
+    header = ["metric", *names]
+    if len(names) == 2:
+        header.append("delta")
+    rows: List[List[str]] = []
+    for metric in next(iter(summaries.values())):
+        values = [summaries[name][metric] for name in names]
+        row = [metric, *(_fmt(metric, v) for v in values)]
+        if len(names) == 2:
+            row.append(_fmt(metric, values[1] - values[0], signed=True))
+        rows.append(row)
+    widths = [max(len(r[i]) for r in [header, *rows]) for i in range(len(header))]
+    lines = [
+        "  ".join(cell.ljust(w) if i == 0 else cell.rjust(w) for i, (cell, w) in enumerate(zip(row, widths)))
+        for row in [header, *rows]
+    ]
+    lines.insert(1, "  ".join("-" * w for w in widths))
+    return "\n".join(lines)
+
+
+def _fmt(metric: str, value: Any, signed: bool = False) -> str:
+    if value != value:  # NaN: nothing solved
+        return "-"
+    sign = "+" if signed else ""
+    if metric == "solve_rate":
+        return f"{value:{sign}.1%}"
+    if isinstance(value, int):
+        return f"{value:{sign}d}"
+    return f"{value:{sign}.1f}"
@@ -0,0 +1,159 @@
+"""
+Append-only game history addressed by absolute offset, with disk archival.
+
+Events are kept in fixed-size segments. With ``hot_segments`` set, only the
+newest segments stay in memory; older full segments are written to
+``archive_dir`` as JSON lines and dropped. Offsets never shift, so
+``len(log)``, ``log[i]`` and ``log[i:j]`` keep working for every consumer
+(``Game.wait_next``, ``Game.stream(start)``); reads below the hot window load
+the archived segment from disk (the last one read is cached).
+
+``append`` archives synchronously by default. ``Game`` appends with
+``archive=False`` under its lock and then awaits ``flush()``, which writes
+overflowing segments in a worker thread; a segment stays readable in memory
+until its file is written.
+"""
+
+from __future__ import annotations
+import asyncio
+import logging
+import shutil
+import tempfile
+import weakref
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, overload
+
+from pydantic import TypeAdapter
+
+from .types import Event
+
+
+log = logging.getLogger(__name__)
+
+_event_adapter: TypeAdapter[Event] = TypeAdapter(Event)
+
+
+class EventLog:
+    def __init__(self, segment_size: int = 1_000, hot_segments: Optional[int] = None, archive_dir: str | Path | None = None):
+        if segment_size < 1 or (hot_segments is not None and hot_segments < 1):
+            raise ValueError("segment_size and hot_segments must be positive.")
+        self.segment_size = segment_size
+        # None keeps every event in memory
+        self.hot_segments = hot_segments
+        self._archive_dir = Path(archive_dir) if archive_dir is not None else None
+        # Resident segments, oldest first; the last one is still being filled
+        self._segments: List[List[Event]] = [[]]
+        self._segment_bytes: List[int] = [0]
+        self._first_resident = 0
+        self._len = 0
+        self.archived_bytes = 0
+        self._cached: tuple[int, List[Event]] | None = None
+        # The running flush(), shared by every caller that awaits it
+        self._writer: asyncio.Future[None] | None = None
+
+    def __len__(self) -> int:
+        return self._len
+
+    def append(self, ev: Event, archive: bool = True):
+        """Add an event; with ``archive=False`` overflowing segments wait for ``flush()``."""
+        if len(self._segments[-1]) == self.segment_size:
+            self._segments.append([])
+            self._segment_bytes.append(0)
+        self._segments[-1].append(ev)
+        # Serialized size, a stable proxy for the event's footprint
+        self._segment_bytes[-1] += len(ev.model_dump_json())
+        self._len += 1
+        if archive:
+            while self._overflow():
+                path = self._path(self._first_resident)
+                self._write(path, self._segments[0])
+                self._drop_oldest(path)
+
+    async def flush(self):
+        """Archive segments beyond the hot window, writing them off the event loop."""
+        if self._writer is None or self._writer.done():
+            if not self._overflow():
+                return
+            self._writer = asyncio.ensure_future(self._archive_overflow())
+        # A cancelled caller leaves the write running for the others
+        await asyncio.shield(self._writer)
+
+    @overload
+    def __getitem__(self, index: int) -> Event: ...
+    @overload
+    def __getitem__(self, index: slice) -> List[Event]: ...
+
+    def __getitem__(self, index: int | slice) -> Event | List[Event]:
+        if isinstance(index, slice):
+            return [self._get(i) for i in range(*index.indices(self._len))]
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("event offset out of range")
+        return self._get(index)
+
+    def __iter__(self) -> Iterator[Event]:
+        for i in range(self._len):
+            yield self._get(i)
+
+    def __reversed__(self) -> Iterator[Event]:
+        for i in reversed(range(self._len)):
+            yield self._get(i)
+
+    def resident(self) -> List[Event]:
+        """Events still in memory (all of them unless archival is on), oldest first."""
+        return [ev for segment in self._segments for ev in segment]
+
+    @property
+    def first_resident(self) -> int:
+        """Offset of the oldest in-memory event."""
+        return self._first_resident * self.segment_size
+
+    def _get(self, i: int) -> Event:
+        seg, pos = divmod(i, self.segment_size)
+        if seg >= self._first_resident:
+            return self._segments[seg - self._first_resident][pos]
+        if self._cached is None or self._cached[0] != seg:
+            self._cached = (seg, self._load(seg))
+        return self._cached[1][pos]
+
+    def _path(self, seg: int) -> Path:
+        if self._archive_dir is None:
+            self._archive_dir = Path(tempfile.mkdtemp(prefix="taboo-events-"))
+            # A directory we created ourselves goes away with the log
+            weakref.finalize(self, shutil.rmtree, self._archive_dir, True)
+        return self._archive_dir / f"segment-{seg:08d}.jsonl"
+
+    def _overflow(self) -> bool:
+        return self.hot_segments is not None and len(self._segments) > self.hot_segments
+
+    async def _archive_overflow(self):
+        while self._overflow():
+            path = self._path(self._first_resident)
+            await asyncio.to_thread(self._write, path, self._segments[0])
+            self._drop_oldest(path)
+
+    @staticmethod
+    def _write(path: Path, segment: List[Event]):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("".join(ev.model_dump_json() + "\n" for ev in segment))
+
+    def _drop_oldest(self, path: Path):
+        self._segments.pop(0)
+        self.archived_bytes += self._segment_bytes.pop(0)
+        log.debug(f"EventLog: archived segment {self._first_resident} to {path}")
+        self._first_resident += 1
+
+    def _load(self, seg: int) -> List[Event]:
+        return [_event_adapter.validate_json(line) for line in self._path(seg).read_text().splitlines()]
+
+    def stats(self) -> Dict[str, Any]:
+        resident = sum(len(s) for s in self._segments)
+        return {
+            "events": self._len,
+            "resident_events": resident,
+            "resident_bytes": sum(self._segment_bytes),
+            "archived_events": self._len - resident,
+            "archived_segments": self._first_resident,
+            "archived_bytes": self.archived_bytes,
+        }
@@ -0,0 +1,92 @@
+"""
+Players backed by FakeLLM, for offline demos, simulations and tests.
+
+They need no network or API keys, so they run on the virtual-clock loop in
+``taboo.simclock``; with seeded FakeLLMs the event ordering is reproducible.
+Calls are charged to the round budget with FakeLLM's rough token counts.
+"""
+from typing import Any, Awaitable, Callable, List, Literal, Optional
+
+from .llm.fakellm import FakeLLM
+from .llm.resilience import Resilience
+from .player import Buzzer, Cluer, CluePacing, Guess, Guesser, Judge, Player
+
+
+async def _call(player: Player, llm: FakeLLM, factory: Callable[[], Awaitable[Any]]) -> Any:
+    with player.charge() as charge:
+        before = llm.tokens
+        try:
+            return await player.guarded(lambda _: factory(), llm.name)
+        finally:
+            charge.tokens = llm.tokens - before
+
+
+class FakeCluer(Cluer):
+    def __init__(self, llm: Optional[FakeLLM] = None, pacing: Optional[CluePacing] = None):
+        super().__init__(pacing=pacing)
+        self.llm = llm or FakeLLM("cluer")
+
+    async def next_clue(self) -> str:
+        return await _call(self, self.llm, lambda: self.llm.clue(self.game.target, self.game.taboo_words, self.game.history()))
+
+
+class FakeBuzzer(Buzzer):
+    def __init__(self, llm: Optional[FakeLLM] = None):
+        super().__init__()
+        self.llm = llm or FakeLLM("buzzer")
+
+    async def _violates(self, text: str) -> str | None:
+        return await _call(self, self.llm, lambda: self.llm.buzz(text, self.game.taboo_words))
+
+
+class FakeJudge(Judge):
+    def __init__(self, llm: Optional[FakeLLM] = None):
+        super().__init__()
+        self.llm = llm or FakeLLM("judge")
+
+    async def check_guess(self, guess: str) -> bool:
+        return await _call(self, self.llm, lambda: self.llm.judge(self.game.target, guess))
+
+
+class FakeGuesser(Guesser):
+    def __init__(
+        self,
+        player_id: str,
+        llm: Optional[FakeLLM] = None,
+        duplicate_policy: Literal["publish", "suppress"] = "publish",
+    ):
+        super().__init__(player_id, duplicate_policy=duplicate_policy)
+        self.llm = llm or FakeLLM(player_id)
+
+    async def next_guess(self) -> Guess:
+        events = self.game.history()
+        clues = [e.clue for e in events if e.role == "cluer"]
+        others = [e.guess for e in events if e.role == "guesser" and e.player_id != self.player_id]
+        guess, rationale = await _call(self, self.llm, lambda: self.llm.guess(clues, others))
+        return Guess(guess=guess, rationale=rationale)
+
+
+def fake_players(
+    guessers: int = 3,
+    seed: Optional[int] = None,
+    tail_prob: float = 0.0,
+    fail_prob: float = 0.0,
+    hang_prob: float = 0.0,
+    resilience: Optional[Resilience] = None,
+    pacing: Optional[CluePacing] = None,
+    duplicate_policy: Literal["publish", "suppress"] = "publish",
+) -> List[Player]:
+    """A full, seeded set of fake players: cluer, buzzer, judge and N guessers.
+
+    ``fail_prob``/``hang_prob`` inject provider failures; ``resilience`` is shared by every player.
+    """
+    def llm(name: str, offset: int) -> FakeLLM:
+        return FakeLLM(name, tail_prob=tail_prob, seed=None if seed is None else seed * 1_000 + offset,
+                       fail_prob=fail_prob, hang_prob=hang_prob)
+
+    players: List[Player] = [FakeCluer(llm("cluer", 0), pacing=pacing), FakeBuzzer(llm("buzzer", 1)), FakeJudge(llm("judge", 2))]
+    for i in range(guessers):
+        players.append(FakeGuesser(f"g{i+1}", llm(f"g{i+1}", 3 + i), duplicate_policy=duplicate_policy))
+    for p in players:
+        p.resilience = resilience
+    return players
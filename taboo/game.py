@@ -1,9 +1,13 @@
 from __future__ import annotations
 import asyncio
 import logging
+from collections import Counter
 from typing import Any, Dict, List
 
 from .types import Event, SystemMessage
+from .event_log import EventLog
+from .guess_index import GuessIndex
+from .budget import BudgetExceeded, RoundBudget
 from .player import Player, Cluer, Buzzer, Guesser, Judge
 
 
@@ -26,32 +30,70 @@ def validate_roles(players: List[Player]):
 
 
 class Game:
-    def __init__(self, target: str, taboo_words: List[str], players: List[Player], duration_sec: int = 120):
+    def __init__(
+        self,
+        target: str,
+        taboo_words: List[str],
+        players: List[Player],
+        duration_sec: int = 120,
+        budget_tokens: int | None = None,
+        event_log: EventLog | None = None,
+        teardown_timeout_sec: float = 2.0,
+    ):
         validate_roles(players)
         self.target = target.strip()
         self.taboo_words = [t.strip() for t in taboo_words]
         self.duration_sec = duration_sec
-        self.events: list[Event] = []
+        # Append-only history by absolute offset; pass a bounded EventLog to archive old events to disk
+        self.events = event_log if event_log is not None else EventLog()
         self._cond = asyncio.Condition()
         self._stop = asyncio.Event()
+        self._started_at: float | None = None
+        # Loop time at which the end event was published; teardown is measured from here
+        self.ended_at: float | None = None
+        self.teardown_timeout_sec = teardown_timeout_sec
+        self.teardown_sec: float | None = None
+        # Tasks that outlived the teardown deadline
+        self.stragglers = 0
+        # Verdicts of already-judged guesses for this round
+        self.guess_index = GuessIndex()
+        # Token spend per agent; with budget_tokens set, the round ends when it runs out
+        self.budget = RoundBudget(budget_tokens)
 
         self.players = players
         for p in self.players:
             p.join(self)
+        # Extra guessers are throttled first when the budget runs low
+        for p in [p for p in self.players if isinstance(p, Guesser)][1:]:
+            p.budget_priority = "low"
 
     async def publish(self, ev: Event):
         async with self._cond:
-            self.events.append(ev)
+            self.events.append(ev, archive=False)
             log.debug(f"Game.publish -> {ev}")
             self._cond.notify_all()
+        # Old segments are written to disk outside the lock, in a worker thread
+        await self.events.flush()
 
     def history(self) -> list[Event]:
+        """The whole round so far, oldest first (archived events are read back from disk)."""
         return list(self.events)
 
+    def hot_history(self) -> list[Event]:
+        """Only the events still in memory: the whole round, or the hot window when the log archives."""
+        return self.events.resident()
+
     # Public termination helpers
     def is_over(self) -> bool:
         return self._stop.is_set()
 
+    def remaining_sec(self) -> float:
+        """Seconds left in the round (the full duration before play() starts)."""
+        if self._started_at is None:
+            return float(self.duration_sec)
+        elapsed = asyncio.get_running_loop().time() - self._started_at
+        return max(0.0, self.duration_sec - elapsed)
+
     # Await until the game is finished.
     async def finished(self) -> None:
         await self._stop.wait()
@@ -71,50 +113,87 @@ class Game:
                 yield ev
 
     async def play(self) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+
         async def timeout():
             await asyncio.sleep(self.duration_sec)
             await self.publish(SystemMessage(role="system", event="timeout"))
 
-        # Launch players and timeout tasks
-        player_tasks: list[asyncio.Task] = [asyncio.create_task(p.play()) for p in self.players]
-        timeout_task = asyncio.create_task(timeout())
+        self._started_at = loop.time()
 
-        try:
-            idx = 0
-            while True:
-                n = await self.wait_next(idx)
-                events = self.events[idx:n]
-                idx = n
-                for ev in events:
-                    if ev.role == "buzzer" and ev.violates_taboo:
-                        self._stop.set()
-                        await self.publish(SystemMessage(role="system", event="end", reason="buzzed"))
-                        raise asyncio.CancelledError()
-                    if ev.role == "judge" and ev.is_correct:
-                        self._stop.set()
-                        end_msg = SystemMessage(role="system", event="end", reason="correct")
-                        if ev.by:
-                            end_msg.winner = ev.by
-                        await self.publish(end_msg)
-                        raise asyncio.CancelledError()
-                    if ev.role == "system" and ev.event == "timeout":
-                        self._stop.set()
-                        await self.publish(SystemMessage(role="system", event="end", reason="timeout"))
-                        raise asyncio.CancelledError()
-        except asyncio.CancelledError:
-            # Signal players to end in-flight work quickly
-            await asyncio.gather(*(p.end() for p in self.players), return_exceptions=True)
-            # Cancel tasks to unblock any waits
-            for t in player_tasks:
-                t.cancel()
-            timeout_task.cancel()
-            await asyncio.gather(*player_tasks, return_exceptions=True)
+        async def budget_watch():
+            await self.budget.exhausted.wait()
+            await self.publish(SystemMessage(role="system", event="budget"))
+
+        async def run_player(p: Player):
             try:
-                await timeout_task
-            except asyncio.CancelledError:
-                pass
+                await p.play()
+            except BudgetExceeded:
+                log.info(f"Game: {p.budget_id} stopped, round budget spent")
+
+        # Launch players, timeout and budget tasks
+        tasks: list[asyncio.Task] = [asyncio.create_task(run_player(p)) for p in self.players]
+        tasks.append(asyncio.create_task(timeout()))
+        tasks.append(asyncio.create_task(budget_watch()))
 
-        return {"events": self.history()}
+        try:
+            await self._watch()
+        finally:
+            if self.ended_at is None:
+                # Cancelled from outside before any end condition
+                self.ended_at = loop.time()
+            await self._teardown(tasks)
+
+        events = self.history()
+        roles = Counter(e.role for e in events)
+        return {
+            # The whole round, archived events included
+            "events": events,
+            "clues": roles["cluer"],
+            "guess_events": roles["guesser"],
+            "guesses": self.guess_index.stats(),
+            "spend": self.budget.stats(),
+            "memory": self.events.stats(),
+            "teardown": {"sec": self.teardown_sec, "stragglers": self.stragglers},
+        }
+
+    async def _watch(self):
+        """Follow the history until an end condition, then publish the end event."""
+        idx = 0
+        while True:
+            n = await self.wait_next(idx)
+            events = self.events[idx:n]
+            idx = n
+            for ev in events:
+                if ev.role == "buzzer" and ev.violates_taboo:
+                    return await self._end(SystemMessage(role="system", event="end", reason="buzzed"))
+                if ev.role == "judge" and ev.is_correct:
+                    return await self._end(SystemMessage(role="system", event="end", reason="correct", winner=ev.by))
+                if ev.role == "system" and ev.event == "timeout":
+                    return await self._end(SystemMessage(role="system", event="end", reason="timeout"))
+                if ev.role == "system" and ev.event == "budget":
+                    return await self._end(SystemMessage(role="system", event="end", reason="budget"))
+
+    async def _end(self, end_msg: SystemMessage):
+        # The end event goes out before any cleanup is awaited; flushing it counts as teardown
+        self._stop.set()
+        self.ended_at = asyncio.get_running_loop().time()
+        await self.publish(end_msg)
+
+    async def _teardown(self, tasks: list[asyncio.Task]):
+        """Cancel every round task and all tracked player work at once, waiting at most teardown_timeout_sec."""
+        loop = asyncio.get_running_loop()
+        for p in self.players:
+            tasks.extend(p.cancel())
+        for t in tasks:
+            t.cancel()
+        _, pending = await asyncio.wait(tasks, timeout=self.teardown_timeout_sec) if tasks else (set(), set())
+        self.stragglers = len(pending)
+        if pending:
+            # Work that ignores cancellation is abandoned rather than holding up the round
+            log.warning(f"Game: {len(pending)} tasks still running {self.teardown_timeout_sec}s after the round ended")
+        assert self.ended_at is not None
+        self.teardown_sec = loop.time() - self.ended_at
 
 
 async def run_game(target: str, taboo_words: List[str], duration_sec: int, players: List[Player]) -> Dict[str, Any]:
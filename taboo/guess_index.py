@@ -0,0 +1,99 @@
+"""
+Per-round index of already-judged guesses.
+
+Guesses are keyed by a normalized form (case, punctuation, articles), so
+exact repeats get their verdict instantly instead of another ``check_guess``
+call. Guesses that only share a light stem (singular/plural, -ing) are hints,
+not repeats: the stemming also merges distinct words (morning/morn,
+news/new), so they still go to the judge.
+"""
+
+from __future__ import annotations
+import re
+from typing import Any, Dict, List, Optional
+
+
+_PUNCT = re.compile(r"[^\w\s]")
+_ARTICLES = ("a ", "an ", "the ")
+
+
+def normalize_guess(text: str) -> str:
+    """Lowercase, drop punctuation and leading articles, collapse whitespace."""
+    text = " ".join(_PUNCT.sub(" ", text.lower()).split())
+    for article in _ARTICLES:
+        if text.startswith(article):
+            text = text[len(article):]
+            break
+    return text
+
+
+def guess_key(text: str) -> str:
+    """Normalized form with light stemming, so near-duplicates share a key."""
+    words = normalize_guess(text).split()
+    if not words:
+        return ""
+    last = words[-1]
+    if last.endswith("ing") and len(last) > 6:
+        last = last[:-3]
+    elif last.endswith("ies") and len(last) > 4:
+        last = last[:-3] + "y"
+    elif last.endswith("es") and len(last) > 4 and last[-3] in "sxz":
+        last = last[:-2]
+    elif last.endswith("s") and not last.endswith("ss") and len(last) > 3:
+        last = last[:-1]
+    return " ".join(words[:-1] + [last])
+
+
+class GuessIndex:
+    def __init__(self):
+        # Verdicts keyed by the exact normalized guess
+        self._verdicts: Dict[str, bool] = {}
+        # Stem key -> first judged guess with that stem
+        self._stems: Dict[str, str] = {}
+        self._rejected: List[str] = []
+        self.judged = 0
+        self.duplicates = 0
+        self.near_duplicates = 0
+        self.suppressed = 0
+
+    def lookup(self, guess: str) -> Optional[bool]:
+        """Verdict of an earlier guess with the same normalized form, or None if it is new."""
+        return self._verdicts.get(normalize_guess(guess))
+
+    def hint(self, guess: str) -> Optional[str]:
+        """An earlier judged guess sharing only the stem of ``guess`` (e.g. its plural), if any."""
+        earlier = self._stems.get(guess_key(guess))
+        return earlier if earlier is not None and earlier != normalize_guess(guess) else None
+
+    def record(self, guess: str, is_correct: bool, duplicate: bool = False):
+        """Record a verdict published by the judge."""
+        self.judged += 1
+        if duplicate:
+            self.duplicates += 1
+            return
+        normalized = normalize_guess(guess)
+        if normalized in self._verdicts:
+            return
+        if self.hint(guess) is not None:
+            self.near_duplicates += 1
+        self._verdicts[normalized] = is_correct
+        key = guess_key(guess)
+        if key not in self._stems:
+            self._stems[key] = normalized
+            if not is_correct:
+                self._rejected.append(normalized)
+
+    def rejected(self) -> List[str]:
+        """Distinct wrong guesses so far, in the order they were judged."""
+        return list(self._rejected)
+
+    def stats(self) -> Dict[str, Any]:
+        attempts = self.judged + self.suppressed
+        return {
+            "judged": self.judged,
+            "duplicates": self.duplicates,
+            "near_duplicates": self.near_duplicates,
+            "suppressed": self.suppressed,
+            # Share of all guess attempts (judged or suppressed) that repeated an earlier one
+            "duplicate_rate": (self.duplicates + self.suppressed) / attempts if attempts else 0.0,
+        }
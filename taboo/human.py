@@ -1,33 +1,130 @@
 """
 Code for human players
 """
-from typing import Optional
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Generic, Hashable, Optional, TypeVar
 import asyncio
 
+from .guess_index import normalize_guess
 from .player import Cluer, Guesser, Guess
 
 
+T = TypeVar("T")
+
+
+class InputQueue(Generic[T]):
+    """
+    Bounded, rate-limited inbox for one human's submissions.
+
+    Items are released at most ``rate_per_sec`` per second, in bursts of up to
+    ``burst`` (a token bucket). A submission whose ``key`` matches a pending
+    item or the last released one is dropped as a repeat. Once ``maxsize`` items are pending, a
+    new submission replaces the newest pending one, so rapid-fire input
+    coalesces to the latest instead of growing with keystrokes.
+    """
+    def __init__(
+        self,
+        maxsize: int = 2,
+        rate_per_sec: float = 1.0,
+        burst: int = 3,
+        key: Callable[[T], Hashable] | None = None,
+    ):
+        if maxsize < 1 or burst < 1 or rate_per_sec <= 0:
+            raise ValueError("maxsize, burst and rate_per_sec must be positive.")
+        self.maxsize = maxsize
+        self.rate_per_sec = rate_per_sec
+        self.burst = burst
+        self._key: Callable[[T], Hashable] = key or (lambda item: item)  # type: ignore[assignment,return-value]
+        self._items: Deque[T] = deque()
+        self._nonempty = asyncio.Event()
+        self._last: Hashable | None = None
+        self._tokens = float(burst)
+        self._stamp: float | None = None
+
+        self.submitted = 0
+        self.released = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.throttled = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def put(self, item: T) -> bool:
+        """Queue ``item``; returns False if it was dropped as a repeat."""
+        self.submitted += 1
+        k = self._key(item)
+        if k == self._last or any(self._key(i) == k for i in self._items):
+            self.dropped += 1
+            return False
+        if len(self._items) >= self.maxsize:
+            self._items[-1] = item
+            self.coalesced += 1
+        else:
+            self._items.append(item)
+        self._nonempty.set()
+        return True
+
+    async def get(self) -> T:
+        while not self._items:
+            self._nonempty.clear()
+            await self._nonempty.wait()
+        await self._take_token()
+        # Waiting for a token may coalesce pending items, never remove them
+        item = self._items.popleft()
+        self._last = self._key(item)
+        self.released += 1
+        return item
+
+    async def _take_token(self):
+        loop = asyncio.get_running_loop()
+        self._refill(loop.time())
+        if self._tokens < 1:
+            self.throttled += 1
+            await asyncio.sleep((1 - self._tokens) / self.rate_per_sec)
+            self._refill(loop.time())
+        self._tokens -= 1
+
+    def _refill(self, now: float):
+        if self._stamp is not None:
+            self._tokens = min(self.burst, self._tokens + (now - self._stamp) * self.rate_per_sec)
+        self._stamp = now
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "submitted": self.submitted,
+            "released": self.released,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "throttled": self.throttled,
+            "pending": len(self._items),
+        }
+
+
 class HumanCluer(Cluer):
     """
     Human (?) cluer that can submit clues to the game via submit().
     """
-    def __init__(self):
+    def __init__(self, maxsize: int = 2, rate_per_sec: float = 1.0, burst: int = 3):
         super().__init__()
-        self._q: asyncio.Queue[str] = asyncio.Queue()
+        # Every clue is checked by the buzzer, so clue spam is bounded too
+        self.inputs: InputQueue[str] = InputQueue(maxsize, rate_per_sec, burst, key=normalize_guess)
 
-    def submit(self, clue: str):
-        self._q.put_nowait(clue)
+    def submit(self, clue: str) -> bool:
+        return self.inputs.put(clue)
 
     async def next_clue(self) -> str:
-        return await self._q.get()
-    
+        return await self.inputs.get()
+
 class HumanGuesser(Guesser):
-    def __init__(self, player_id: str):
+    def __init__(self, player_id: str, maxsize: int = 2, rate_per_sec: float = 1.0, burst: int = 3):
         super().__init__(player_id)
-        self._q: asyncio.Queue[Guess] = asyncio.Queue()
+        # Every released guess is judged, so judge traffic grows with players, not keystrokes.
+        # Repeats are detected the way the guess index does (case, punctuation, articles)
+        self.inputs: InputQueue[Guess] = InputQueue(maxsize, rate_per_sec, burst, key=lambda g: normalize_guess(g.guess))
 
-    def submit(self, guess: str, rationale: Optional[str] = None):
-        self._q.put_nowait(Guess(guess=guess, rationale=rationale))
+    def submit(self, guess: str, rationale: Optional[str] = None) -> bool:
+        return self.inputs.put(Guess(guess=guess, rationale=rationale))
 
     async def next_guess(self) -> Guess:
-        return await self._q.get()
+        return await self.inputs.get()
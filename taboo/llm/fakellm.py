@@ -1,23 +1,68 @@
 import asyncio
 import random
-from typing import List, Tuple
+import re
+from typing import List, Optional, Tuple
+
+
+class FakeLLMError(RuntimeError):
+    """An injected provider failure."""
+
 
 class FakeLLM:
-    """A latency-simulating fake model used for V0 demos and tests."""
-    def __init__(self, name: str):
+    """A latency-simulating fake model used for V0 demos and tests.
+
+    With ``tail_prob > 0`` a fraction of calls is drawn from ``tail_latency``
+    instead, giving the long-tail latency distribution of a real provider.
+    ``fail_prob`` and ``hang_prob`` inject provider errors and calls that hang
+    for ``hang_sec``. ``tokens`` is a rough usage count (~4 characters per
+    prompt token plus a fixed-size completion).
+    """
+    def __init__(
+        self,
+        name: str,
+        tail_prob: float = 0.0,
+        tail_latency: Tuple[float, float] = (2.0, 5.0),
+        seed: Optional[int] = None,
+        fail_prob: float = 0.0,
+        hang_prob: float = 0.0,
+        hang_sec: float = 3_600.0,
+    ):
         self.name = name
+        self.tail_prob = tail_prob
+        self.tail_latency = tail_latency
+        self.rng = random.Random(seed)
+        self.fail_prob = fail_prob
+        self.hang_prob = hang_prob
+        self.hang_sec = hang_sec
+        self.calls = 0
+        self.tokens = 0
+
+    def latency(self, low: float, high: float) -> float:
+        if self.tail_prob and self.rng.random() < self.tail_prob:
+            return self.rng.uniform(*self.tail_latency)
+        return self.rng.uniform(low, high)
+
+    async def respond(self, low: float, high: float, prompt: str = ""):
+        """Simulate one provider round-trip, with any injected failure."""
+        self.calls += 1
+        self.tokens += len(prompt) // 4 + 20
+        if self.hang_prob and self.rng.random() < self.hang_prob:
+            await asyncio.sleep(self.hang_sec)
+        await asyncio.sleep(self.latency(low, high))
+        if self.fail_prob and self.rng.random() < self.fail_prob:
+            raise FakeLLMError(f"{self.name}: injected provider error")
 
     async def clue(self, target: str, taboo: List[str], history: list) -> str:
-        # simulate latency
-        await asyncio.sleep(random.uniform(0.15, 0.9))
+        await self.respond(0.15, 0.9, f"{target} {taboo} {history}")
         # extremely naive clue generation (avoid taboo words by redaction)
-        base = f"Common thing related to {target[0].upper()} and {len(target)} letters."
+        # lead with the first letter, which guess() uses as its hint
+        base = f"{target[0].upper()}: common thing with {len(target)} letters."
         for t in taboo:
             base = base.replace(t, "[redacted]")
         return base
 
     async def guess(self, clues: List[str], other_guesses: List[str]) -> Tuple[str, str]:
-        await asyncio.sleep(random.uniform(0.2, 1.1))
+        await self.respond(0.2, 1.1, f"{clues} {other_guesses}")
         # naive: derive a guess based on letters mentioned or random nouns
         nouns = ["apple","table","river","python","guitar","window","planet","coffee"]
         # tilt toward words appearing in clues (first letter hints)
@@ -33,6 +78,16 @@ class FakeLLM:
             options = [n for n in nouns if n.startswith(letter)] or nouns
         else:
             options = nouns
-        guess = random.choice(options)
+        guess = self.rng.choice(options)
         rationale = f"Based on clues and letter '{letter}'" if letter else "Heuristic guess"
         return guess, rationale
+
+    async def judge(self, target: str, guess: str) -> bool:
+        await self.respond(0.05, 0.3, f"{target} {guess}")
+        return guess.strip().lower() == target.strip().lower()
+
+    async def buzz(self, clue: str, taboo: List[str]) -> Optional[str]:
+        await self.respond(0.05, 0.3, f"{clue} {taboo}")
+        words = set(re.findall(r"\w+", clue.lower()))
+        hits = [t for t in taboo if t.lower() in words]
+        return f"uses taboo word '{hits[0]}'" if hits else None
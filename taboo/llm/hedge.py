@@ -0,0 +1,116 @@
+"""
+Hedged LLM requests for calls on the critical path.
+
+If a call has not returned by an adaptive deadline (a running quantile of
+recent latencies, timed from when each request was issued), a duplicate is
+issued; the first result wins and the loser is cancelled. Hedges are capped to a fraction of calls so a slow provider is
+not hit with double the traffic.
+"""
+
+from __future__ import annotations
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, TypeVar
+
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class Hedger:
+    def __init__(
+        self,
+        quantile: float = 0.9,
+        window: int = 100,
+        min_samples: int = 10,
+        initial_delay_sec: float = 1.0,
+        min_delay_sec: float = 0.05,
+        max_hedge_rate: float = 0.1,
+    ):
+        if not 0.0 < quantile < 1.0:
+            raise ValueError("quantile must be between 0 and 1.")
+        self.quantile = quantile
+        self.min_samples = min_samples
+        self.initial_delay_sec = initial_delay_sec
+        self.min_delay_sec = min_delay_sec
+        self.max_hedge_rate = max_hedge_rate
+        self._latencies: deque[float] = deque(maxlen=window)
+
+        self.calls = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.capped = 0
+
+    def delay(self) -> float:
+        """Seconds to wait on the primary call before hedging it."""
+        if len(self._latencies) < self.min_samples:
+            return self.initial_delay_sec
+        ordered = sorted(self._latencies)
+        idx = min(len(ordered) - 1, int(self.quantile * len(ordered)))
+        return max(self.min_delay_sec, ordered[idx])
+
+    def _may_hedge(self) -> bool:
+        # Counting the hedge about to be issued, so early calls cannot exceed the cap
+        return self.hedges + 1 <= self.max_hedge_rate * self.calls
+
+    async def call(self, factory: Callable[[], Awaitable[T]]) -> T:
+        """Await ``factory()``, hedging with a second ``factory()`` if it is slow.
+
+        ``factory`` must start a fresh, independent call each time it is invoked.
+        """
+        loop = asyncio.get_running_loop()
+        self.calls += 1
+        started: Dict[asyncio.Task[Any], float] = {}
+
+        def launch() -> asyncio.Task[Any]:
+            task = asyncio.ensure_future(factory())
+            started[task] = loop.time()
+            return task
+
+        primary = launch()
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.delay())
+            if not done:
+                if self._may_hedge():
+                    self.hedges += 1
+                    log.debug("Hedger: primary exceeded %.3fs, issuing hedge", self.delay())
+                    tasks.add(launch())
+                else:
+                    self.capped += 1
+
+            error: BaseException | None = None
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.cancelled():
+                        continue
+                    if task.exception() is not None:
+                        error = error or task.exception()
+                        continue
+                    # Timed from when the request was issued: a hedge that wins reports the
+                    # whole wait, so slow primaries still push the quantile up
+                    self._latencies.append(loop.time() - started[primary])
+                    if task is not primary:
+                        self.hedge_wins += 1
+                    return task.result()
+            raise error if error is not None else asyncio.CancelledError()
+        finally:
+            for task in started:
+                if not task.done():
+                    task.cancel()
+            pending = [t for t in started if not t.done()]
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "capped": self.capped,
+            "hedge_rate": self.hedges / self.calls if self.calls else 0.0,
+            "delay_sec": self.delay(),
+        }
@@ -0,0 +1,140 @@
+"""
+Prompt rendering that reuses the static per-card and per-agent prefix.
+
+Agent signatures list their static inputs first (instructions, target, taboo
+words, player id, personality) and the per-call ones (history, rejected
+guesses, the clue or guess being checked) last, and declare the static ones
+with ``@static_inputs(...)``. ``PromptPrefixCache`` is a ``ChatAdapter`` that
+renders the system message and the declared static fields once per
+(signature, static values) and only renders the per-call tail. Undeclared
+fields are always rendered per call. Its messages are byte-identical to
+``ChatAdapter``'s, so the provider sees the same prefix on every call of a
+round and can serve it from its prompt cache.
+"""
+
+from __future__ import annotations
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Tuple, TypeVar
+
+from dspy.adapters import ChatAdapter
+from dspy.adapters.types.base_type import split_message_content_for_custom_types
+from dspy.adapters.utils import format_field_value
+from dspy.signatures.signature import Signature
+
+
+# Signature -> its declared static input fields
+_static_inputs: weakref.WeakKeyDictionary[type[Signature], Tuple[str, ...]] = weakref.WeakKeyDictionary()
+
+S = TypeVar("S", bound=type[Signature])
+
+
+def static_inputs(*names: str) -> Callable[[S], S]:
+    """Declare a signature's static inputs; they must be its leading input fields, in order.
+
+    Use as a class decorator, or call on a derived signature (``append`` makes a new class).
+    """
+    def declare(signature: S) -> S:
+        leading = tuple(signature.input_fields)[:len(names)]
+        if leading != names:
+            raise ValueError(f"{signature.__name__}: static inputs {names} must be the leading input fields, got {leading}")
+        _static_inputs[signature] = names
+        return signature
+    return declare
+
+
+def declared_static_inputs(signature: type[Signature]) -> Tuple[str, ...]:
+    """Static inputs declared for ``signature`` (none if undeclared: only the system message is reused)."""
+    return _static_inputs.get(signature, ())
+
+
+class PrefixStats:
+    """Per-signature counters: prefix reuse and how much of each prompt is a stable prefix."""
+
+    def __init__(self):
+        self.calls = 0
+        self.hits = 0
+        self.prompt_chars = 0
+        self.prefix_chars = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "hits": self.hits,
+            "hit_rate": self.hits / self.calls if self.calls else 0.0,
+            "prompt_chars": self.prompt_chars,
+            "prefix_chars": self.prefix_chars,
+            "cacheable_prefix_ratio": self.prefix_chars / self.prompt_chars if self.prompt_chars else 0.0,
+        }
+
+
+class PromptPrefixCache(ChatAdapter):
+    def __init__(self, max_entries: int = 1_024):
+        super().__init__()
+        self.max_entries = max_entries
+        # (signature, static values) -> (system message, rendered static fields, output format reminder)
+        self._prefixes: OrderedDict[Tuple[Any, ...], Tuple[str, str, str | None]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats: Dict[str, PrefixStats] = {}
+
+    def format(self, signature: type[Signature], demos: list[dict[str, Any]], inputs: dict[str, Any]) -> list[dict[str, Any]]:
+        if demos or self._get_history_field_name(signature):
+            return super().format(signature, demos, inputs)
+
+        static = [name for name in declared_static_inputs(signature) if name in inputs]
+        key = (signature, *((name, repr(inputs[name])) for name in static))
+        with self._lock:
+            cached = self._prefixes.get(key)
+            if cached is not None:
+                self._prefixes.move_to_end(key)
+            stats = self._stats.setdefault(signature.__name__, PrefixStats())
+            stats.calls += 1
+            stats.hits += cached is not None
+        if cached is None:
+            system = (
+                f"{self.format_field_description(signature)}\n"
+                f"{self.format_field_structure(signature)}\n"
+                f"{self.format_task_description(signature)}"
+            )
+            rendered = (system, self._render(signature, inputs, static), self.user_message_output_requirements(signature))
+            with self._lock:
+                # Another thread may have rendered the same prefix meanwhile; keep the first
+                cached = self._prefixes.setdefault(key, rendered)
+                while len(self._prefixes) > self.max_entries:
+                    self._prefixes.popitem(last=False)
+        system, prefix, requirements = cached
+
+        tail = self._render(signature, inputs, [name for name in signature.input_fields if name in inputs and name not in static])
+        content = "\n\n".join(part for part in (prefix, tail, requirements) if part)
+
+        with self._lock:
+            stats.prompt_chars += len(system) + len(content)
+            # The static fields are followed by the first per-call field header, or the reminder
+            stats.prefix_chars += len(system) + len(prefix)
+        return split_message_content_for_custom_types([
+            {"role": "system", "content": system},
+            {"role": "user", "content": content},
+        ])
+
+    @staticmethod
+    def _render(signature: type[Signature], inputs: dict[str, Any], names: list[str]) -> str:
+        fields = signature.input_fields
+        return "\n\n".join(f"[[ ## {name} ## ]]\n{format_field_value(field_info=fields[name], value=inputs[name])}" for name in names)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {name: s.snapshot() for name, s in self._stats.items()}
+
+    def clear(self):
+        with self._lock:
+            self._prefixes.clear()
+            self._stats.clear()
+
+
+_shared = PromptPrefixCache()
+
+
+def prompt_cache() -> PromptPrefixCache:
+    """The adapter every agent call renders its prompt with (see ``usage_scope``)."""
+    return _shared
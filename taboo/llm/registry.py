@@ -0,0 +1,178 @@
+"""
+Shared, pooled LM clients keyed by model configuration.
+
+Agents ask the registry for an LM instead of constructing their own ``dspy.LM``.
+Every agent asking for the same (model, temperature, max_tokens) gets the same
+client, so 20 guessers on one model share one request cache, one history and
+litellm's pooled HTTP connections, which stay warm across calls and rounds.
+"""
+
+from __future__ import annotations
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Hashable, Iterator, Tuple
+
+import dspy
+from dspy.utils.usage_tracker import UsageTracker, track_usage
+
+from .prompt_cache import prompt_cache
+
+
+LMKey = Tuple[str, float, int, Tuple[Tuple[str, Hashable], ...]]
+
+
+class LMStats:
+    """Thread-safe per-client counters, used to check reuse and load."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.acquired = 0
+        self.calls = 0
+        self.errors = 0
+        self.cache_hits = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.latency_sec = 0.0
+
+    def __deepcopy__(self, memo):
+        # LM.copy() deep-copies the client; a copy is a new client with its own counters.
+        return LMStats()
+
+    def on_acquire(self):
+        with self._lock:
+            self.acquired += 1
+
+    def on_start(self):
+        with self._lock:
+            self.calls += 1
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def on_finish(self, elapsed: float, results: Any = None, error: bool = False):
+        with self._lock:
+            self.in_flight -= 1
+            self.latency_sec += elapsed
+            if error:
+                self.errors += 1
+                return
+            if getattr(results, "cache_hit", False):
+                self.cache_hits += 1
+                return
+            usage = getattr(results, "usage", None)
+            if usage is not None:
+                usage = dict(usage)
+                self.prompt_tokens += usage.get("prompt_tokens") or 0
+                self.completion_tokens += usage.get("completion_tokens") or 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "acquired": self.acquired,
+                "calls": self.calls,
+                "errors": self.errors,
+                "cache_hits": self.cache_hits,
+                "in_flight": self.in_flight,
+                "peak_in_flight": self.peak_in_flight,
+                "prompt_tokens": self.prompt_tokens,
+                "completion_tokens": self.completion_tokens,
+                "mean_latency_sec": self.latency_sec / self.calls if self.calls else 0.0,
+            }
+
+
+class PooledLM(dspy.LM):
+    """A ``dspy.LM`` that records per-client usage counters."""
+
+    def __init__(self, model: str, **kwargs):
+        super().__init__(model=model, **kwargs)
+        self.stats = LMStats()
+
+    def forward(self, prompt=None, messages=None, **kwargs):
+        self.stats.on_start()
+        start = time.perf_counter()
+        try:
+            results = super().forward(prompt=prompt, messages=messages, **kwargs)
+        except BaseException:
+            self.stats.on_finish(time.perf_counter() - start, error=True)
+            raise
+        self.stats.on_finish(time.perf_counter() - start, results)
+        return results
+
+    async def aforward(self, prompt=None, messages=None, **kwargs):
+        self.stats.on_start()
+        start = time.perf_counter()
+        try:
+            results = await super().aforward(prompt=prompt, messages=messages, **kwargs)
+        except BaseException:
+            self.stats.on_finish(time.perf_counter() - start, error=True)
+            raise
+        self.stats.on_finish(time.perf_counter() - start, results)
+        return results
+
+
+_lock = threading.Lock()
+_clients: Dict[LMKey, PooledLM] = {}
+
+
+def lm_key(model: str, temperature: float, max_tokens: int, **kwargs: Hashable) -> LMKey:
+    return (model, float(temperature), int(max_tokens), tuple(sorted(kwargs.items())))
+
+
+def get_lm(model: str, temperature: float = 1.0, max_tokens: int = 2_000, **kwargs: Hashable) -> PooledLM:
+    """Return the shared client for this configuration, creating it on first use.
+
+    Extra keyword arguments (e.g. ``cache=False``) are part of the key and are
+    passed to ``dspy.LM``; they must be hashable.
+    """
+    key = lm_key(model, temperature, max_tokens, **kwargs)
+    with _lock:
+        lm = _clients.get(key)
+        if lm is None:
+            lm = PooledLM(model=model, temperature=temperature, max_tokens=max_tokens, **kwargs)
+            _clients[key] = lm
+    lm.stats.on_acquire()
+    return lm
+
+
+def sibling_lm(lm: dspy.LM, model: str) -> dspy.LM:
+    """The shared client for ``model`` with the same settings as ``lm`` (``lm`` itself for its own model)."""
+    if model == lm.model:
+        return lm
+    kwargs = dict(lm.kwargs)
+    return get_lm(model, kwargs.pop("temperature", 1.0), kwargs.pop("max_tokens", 2_000), **kwargs)
+
+
+def lm_stats() -> Dict[str, Dict[str, Any]]:
+    """Counters for every pooled client, keyed by a readable form of its key."""
+    with _lock:
+        clients = list(_clients.items())
+    return {
+        f"{model}@t={temperature},max_tokens={max_tokens}" + "".join(f",{k}={v}" for k, v in extra): lm.stats.snapshot()
+        for (model, temperature, max_tokens, extra), lm in clients
+    }
+
+
+def clear_registry() -> None:
+    """Drop all pooled clients (mainly for tests)."""
+    with _lock:
+        _clients.clear()
+
+
+@contextmanager
+def usage_scope(lm: dspy.LM) -> Iterator[UsageTracker]:
+    """Run DSPy calls on ``lm`` while recording their token usage.
+
+    Tasks started inside the scope (hedges, streams) report into the same tracker.
+    Prompts are rendered by the shared prefix cache, so static prefixes are reused.
+    """
+    with dspy.context(lm=lm, adapter=prompt_cache(), track_usage=True), track_usage() as tracker:
+        yield tracker
+
+
+def total_tokens(tracker: UsageTracker) -> int:
+    return sum(
+        (usage.get("prompt_tokens") or 0) + (usage.get("completion_tokens") or 0)
+        for usage in tracker.get_total_tokens().values()
+    )
@@ -0,0 +1,203 @@
+"""
+Deadlines, retries and circuit breakers for agent LLM calls.
+
+Every call gets a deadline derived from the time left in the round, so a hung
+provider cannot outlive the round. Failed attempts are retried with jittered
+exponential backoff, but only while the retry can still land before the
+deadline. Each model has a circuit breaker: after repeated failures it opens
+and calls fail fast to the model's fallback, or are skipped with CallSkipped.
+"""
+
+from __future__ import annotations
+import asyncio
+import logging
+import random
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
+
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+OUTCOMES = ("ok", "retried", "timeout", "error", "out_of_time", "short_circuit", "fallback", "skipped")
+
+
+class CallSkipped(Exception):
+    """No model answered before the deadline; the caller should skip this turn."""
+
+    def __init__(self, message: str, retry_after: float = 0.0):
+        super().__init__(message)
+        # Seconds until trying again is worthwhile (e.g. until a breaker half-opens)
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """Opens after ``failure_threshold`` consecutive failures; lets one probe through after ``reset_after_sec``."""
+
+    def __init__(self, failure_threshold: int = 5, reset_after_sec: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_after_sec = reset_after_sec
+        self.failures = 0
+        self.opened = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @staticmethod
+    def _now() -> float:
+        return asyncio.get_running_loop().time()
+
+    def retry_after(self) -> float:
+        """Seconds until the breaker half-opens (0 when it is closed)."""
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_after_sec - self._now())
+
+    def allow(self) -> bool:
+        """Whether a call may go to this model now."""
+        if self._opened_at is None:
+            return True
+        if self.retry_after() > 0 or self._probing:
+            return False
+        # Half-open: a single probe decides whether the breaker closes again
+        self._probing = True
+        return True
+
+    def record_success(self):
+        self.failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self):
+        self.failures += 1
+        if self._probing:
+            self._opened_at = self._now()
+            self._probing = False
+        elif self._opened_at is None and self.failures >= self.failure_threshold:
+            self._opened_at = self._now()
+            self.opened += 1
+
+    def release(self):
+        """Give up a probe without a verdict (e.g. the call was cancelled)."""
+        self._probing = False
+
+    def stats(self) -> Dict[str, Any]:
+        return {"open": self._opened_at is not None, "failures": self.failures, "opened": self.opened}
+
+
+class Resilience:
+    """Shared by the agents of a game (or session) so breakers see every call to a model."""
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_sec: float = 0.25,
+        max_backoff_sec: float = 2.0,
+        min_call_sec: float = 0.5,
+        max_call_sec: float = 30.0,
+        failure_threshold: int = 5,
+        reset_after_sec: float = 30.0,
+        fallbacks: Optional[Dict[str, str]] = None,
+        seed: Optional[int] = None,
+    ):
+        self.max_attempts = max_attempts
+        self.backoff_sec = backoff_sec
+        self.max_backoff_sec = max_backoff_sec
+        # An attempt with less time than this left is not started
+        self.min_call_sec = min_call_sec
+        self.max_call_sec = max_call_sec
+        self.failure_threshold = failure_threshold
+        self.reset_after_sec = reset_after_sec
+        # Model to fail over to when a model's breaker is open or its attempts ran out
+        self.fallbacks = fallbacks or {}
+        self.rng = random.Random(seed)
+        self.outcomes: Counter[str] = Counter()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def breaker(self, model: str) -> CircuitBreaker:
+        if model not in self._breakers:
+            self._breakers[model] = CircuitBreaker(self.failure_threshold, self.reset_after_sec)
+        return self._breakers[model]
+
+    def chain(self, model: str) -> List[str]:
+        """``model`` followed by its fallbacks, in order."""
+        models = [model]
+        while models[-1] in self.fallbacks and self.fallbacks[models[-1]] not in models:
+            models.append(self.fallbacks[models[-1]])
+        return models
+
+    def backoff(self, attempt: int) -> float:
+        # Full jitter keeps agents that failed together from retrying together
+        return self.rng.uniform(0.0, min(self.max_backoff_sec, self.backoff_sec * 2 ** attempt))
+
+    async def call(self, factory: Callable[[str], Awaitable[T]], model: str, remaining_sec: float | None = None) -> T:
+        """Await ``factory(model)``, retrying and failing over within the deadline.
+
+        ``factory`` must start a fresh call on the given model each time it is
+        invoked. The deadline is ``max_call_sec``, capped by ``remaining_sec``
+        (the time left in the round). Raises CallSkipped if no model answered.
+        """
+        loop = asyncio.get_running_loop()
+        budget = self.max_call_sec if remaining_sec is None else min(self.max_call_sec, remaining_sec)
+        deadline = loop.time() + budget
+        models = self.chain(model)
+        for i, m in enumerate(models):
+            breaker = self.breaker(m)
+            if not breaker.allow():
+                self.outcomes["short_circuit"] += 1
+                continue
+            ok, result = await self._attempts(factory, m, breaker, deadline)
+            if ok:
+                if i:
+                    self.outcomes["fallback"] += 1
+                    log.info("resilience: %s answered for %s", m, model)
+                return result  # type: ignore[return-value]
+        self.outcomes["skipped"] += 1
+        retry_after = max(self.backoff_sec, min(self.breaker(m).retry_after() for m in models))
+        raise CallSkipped(f"no answer from {' -> '.join(models)} in time", retry_after)
+
+    async def _attempts(
+        self, factory: Callable[[str], Awaitable[T]], model: str, breaker: CircuitBreaker, deadline: float,
+    ) -> Tuple[bool, T | None]:
+        loop = asyncio.get_running_loop()
+        for attempt in range(self.max_attempts):
+            left = deadline - loop.time()
+            if left < self.min_call_sec:
+                self.outcomes["out_of_time"] += 1
+                breaker.release()
+                return False, None
+            if attempt:
+                self.outcomes["retried"] += 1
+            try:
+                result = await asyncio.wait_for(factory(model), left)
+            except asyncio.CancelledError:
+                breaker.release()
+                raise
+            except asyncio.TimeoutError:
+                self.outcomes["timeout"] += 1
+                breaker.record_failure()
+                log.info("resilience: %s timed out after %.1fs", model, left)
+            except Exception as e:
+                self.outcomes["error"] += 1
+                breaker.record_failure()
+                log.info("resilience: %s failed: %s", model, e)
+            else:
+                self.outcomes["ok"] += 1
+                breaker.record_success()
+                return True, result
+            if attempt + 1 == self.max_attempts or not breaker.allow():
+                # Out of attempts, or the breaker just opened: fail fast to the fallback
+                return False, None
+            delay = self.backoff(attempt)
+            if loop.time() + delay + self.min_call_sec > deadline:
+                self.outcomes["out_of_time"] += 1
+                breaker.release()
+                return False, None
+            await asyncio.sleep(delay)
+        return False, None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **{k: self.outcomes[k] for k in OUTCOMES},
+            "breakers": {m: b.stats() for m, b in self._breakers.items()},
+        }
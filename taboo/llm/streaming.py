@@ -0,0 +1,114 @@
+"""
+Streaming agent calls that surface an output field as soon as it is complete.
+
+A ``StreamedCall`` drives a streamified DSPy predictor in the background. The
+awaited field (e.g. ``clue`` or ``guess``) resolves the moment its last token
+arrives, while the full prediction (with trailing fields like ``rationale``)
+resolves on completion.
+"""
+
+from __future__ import annotations
+import asyncio
+from typing import Any, Dict, List
+
+import dspy
+from dspy.streaming import StreamListener, StreamResponse
+from dspy.utils.usage_tracker import UsageTracker
+
+from .prompt_cache import PromptPrefixCache
+from .registry import total_tokens
+
+
+class StreamStats:
+    """Field-ready vs full-completion latency for streamed calls."""
+
+    def __init__(self):
+        self.field_ready: List[float] = []
+        self.completed: List[float] = []
+
+    def record(self, field_ready: float, completed: float):
+        self.field_ready.append(field_ready)
+        self.completed.append(completed)
+
+    def summary(self) -> Dict[str, Any]:
+        n = len(self.completed)
+        if not n:
+            return {"calls": 0, "mean_field_ready_sec": 0.0, "mean_completion_sec": 0.0, "mean_saved_sec": 0.0}
+        ready = sum(self.field_ready) / n
+        done = sum(self.completed) / n
+        return {"calls": n, "mean_field_ready_sec": ready, "mean_completion_sec": done, "mean_saved_sec": done - ready}
+
+
+def _listener(field: str) -> StreamListener:
+    listener = StreamListener(signature_field_name=field)
+    # The prefix cache renders prompts differently but parses completions like ChatAdapter
+    listener.adapter_identifiers[PromptPrefixCache.__name__] = listener.adapter_identifiers["ChatAdapter"]
+    return listener
+
+
+class StreamedCall:
+    def __init__(self, predictor: dspy.Predict, field: str, stats: StreamStats | None = None, **inputs: Any):
+        self.field_name = field
+        self._program = dspy.streamify(
+            predictor,
+            stream_listeners=[_listener(field)],
+            is_async_program=True,
+        )
+        self._inputs = inputs
+        self._stats = stats
+        loop = asyncio.get_running_loop()
+        self._field: asyncio.Future[str] = loop.create_future()
+        self._prediction: asyncio.Future[dspy.Prediction] = loop.create_future()
+
+    async def drive(self) -> None:
+        """Consume the stream, resolving the field and then the prediction."""
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        field_ready: float | None = None
+        chunks: List[str] = []
+        try:
+            async for value in self._program(**self._inputs):
+                if isinstance(value, StreamResponse) and value.signature_field_name == self.field_name:
+                    chunks.append(value.chunk)
+                    if value.is_last_chunk and not self._field.done():
+                        field_ready = loop.time() - start
+                        self._field.set_result("".join(chunks).strip())
+                elif isinstance(value, dspy.Prediction):
+                    completed = loop.time() - start
+                    # Cache hits arrive as a single prediction with no field chunks
+                    if not self._field.done():
+                        field_ready = completed
+                        self._field.set_result(value[self.field_name])
+                    self._prediction.set_result(value)
+                    if self._stats is not None:
+                        self._stats.record(field_ready if field_ready is not None else completed, completed)
+        except asyncio.CancelledError:
+            self._field.cancel()
+            self._prediction.cancel()
+            raise
+        except Exception as e:
+            # Errors surface to whoever awaits field() / prediction(), not to the driver task
+            for fut in (self._field, self._prediction):
+                if not fut.done():
+                    fut.set_exception(e)
+                    fut.exception()
+        finally:
+            if not self._prediction.done():
+                self._prediction.cancel()
+            if not self._field.done():
+                self._field.cancel()
+
+    async def field(self) -> str:
+        return await asyncio.shield(self._field)
+
+    async def prediction(self) -> dspy.Prediction:
+        return await asyncio.shield(self._prediction)
+
+    async def settle(self, charge: Any, usage: UsageTracker) -> None:
+        """Settle a round-budget charge with this call's tokens once it completes."""
+        try:
+            await self.prediction()
+        except Exception:
+            pass
+        finally:
+            charge.settle(total_tokens(usage))
@@ -5,7 +5,9 @@ Abstract base classes different types of players in a Taboo game.
 from __future__ import annotations
 from abc import ABC
 import asyncio
-from typing import TYPE_CHECKING, Generic, TypeVar, Optional, Any, Coroutine
+from collections import Counter
+import logging
+from typing import TYPE_CHECKING, Awaitable, Callable, Generic, Literal, TypeVar, Optional, Any, Coroutine
 
 if TYPE_CHECKING:
     from taboo.game import Game
@@ -13,17 +15,33 @@ if TYPE_CHECKING:
 from pydantic import BaseModel
 
 from .types import ClueEvent, BuzzEvent, GuessEvent, JudgeEvent, SystemMessage
+from .budget import BudgetThrottled, Charge, Priority, RoundBudget
+from .llm.resilience import CallSkipped, Resilience
 
 
+log = logging.getLogger(__name__)
+
+T = TypeVar('T')
 EventT = TypeVar('EventT', bound=ClueEvent | BuzzEvent | GuessEvent | JudgeEvent | SystemMessage)
 
 
 class Player(Generic[EventT], ABC):
+    role: str = "player"
+
     def __init__(self):
         self._game: Optional['Game'] = None
         self.id = id(self)
         # Pending tasks so we can cancel them at game over
         self._pending: set[asyncio.Task[Any]] = set()
+        # Low-priority players are throttled first when the round budget runs low
+        self.budget_priority: Priority = "high"
+        # Optional deadlines/retries/circuit breakers around LLM calls (see guarded())
+        self.resilience: Resilience | None = None
+
+    @property
+    def budget_id(self) -> str:
+        """Name this player's LLM spend is recorded under."""
+        return self.role
 
     async def announce(self, event: EventT):
         """Announce an event (e.g. a clue, a guess) to all the other players"""
@@ -33,18 +51,20 @@ class Player(Generic[EventT], ABC):
         """Main loop of the player. Override in subclasses."""
         raise NotImplementedError
 
-    async def end(self):
-        """Cancel and await any in-flight work started via this base class."""
-        if not self._pending:
-            return
-        # Cancel all tracked tasks
-        for t in self._pending:
+    def cancel(self) -> list[asyncio.Task[Any]]:
+        """Cancel in-flight work started via run(...)/spawn(...) without waiting; returns the tasks."""
+        tasks = list(self._pending)
+        self._pending.clear()
+        for t in tasks:
             if not t.done():
                 t.cancel()
-        # Await completion, suppressing cancellation
-        done, pending = await asyncio.wait(self._pending, return_when=asyncio.ALL_COMPLETED)
-        self._pending.clear()
-        return None
+        return tasks
+
+    async def end(self):
+        """Cancel and await any in-flight work started via this base class."""
+        tasks = self.cancel()
+        if tasks:
+            await asyncio.wait(tasks, return_when=asyncio.ALL_COMPLETED)
 
     def join(self, game: 'Game') -> Player[EventT]:
         """Associate this player with a game, must be called before play()"""
@@ -64,6 +84,46 @@ class Player(Generic[EventT], ABC):
         finally:
             self._pending.discard(task)
 
+    def charge(self) -> Charge:
+        """Reserve round budget for one LLM call.
+
+        Use as a context manager and set ``.tokens`` to the actual usage, or call
+        ``.settle(tokens)`` later. Raises BudgetExceeded/BudgetThrottled.
+        """
+        budget = getattr(self.game, "budget", None)
+        if not isinstance(budget, RoundBudget):
+            # Games without a round budget (e.g. test doubles) are not metered
+            return Charge(None, self.budget_id, 0)
+        return budget.charge(self.budget_id, self.budget_priority)
+
+    async def guarded(self, factory: Callable[[str], Awaitable[T]], model: str) -> T:
+        """Run ``factory(model)`` as a tracked task, through the resilience layer if one is set.
+
+        With resilience, the call's deadline is the time left in the round and
+        ``factory`` may be invoked again (retries, fallback models). Raises
+        CallSkipped when no model answered in time.
+        """
+        if self.resilience is None:
+            return await self.run(factory(model))  # type: ignore[arg-type]
+        return await self.run(self.resilience.call(factory, model, remaining_sec=self.game.remaining_sec()))
+
+    async def back_off(self, timeout: float | None = None):
+        """Wait until something new happens in the round, or at most ``timeout`` seconds."""
+        try:
+            await asyncio.wait_for(self.game.wait_next(len(self.game.events)), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def spawn(self, coro: Coroutine[Any, Any, Any]) -> asyncio.Task[Any]:
+        """Start a coroutine as a tracked background task without awaiting it.
+
+        Like run(...), spawned tasks are cancelled and awaited when end() is called.
+        """
+        task = asyncio.create_task(coro)
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+        return task
+
     @property
     def game(self) -> 'Game':
         if self._game is None:
@@ -74,25 +134,127 @@ class Player(Generic[EventT], ABC):
 
 # ---- Players ----
 
+class CluePacing(BaseModel):
+    """When the cluer may publish its next clue; the first cue that fires wins."""
+    # After this many judged guesses since the last clue
+    after_judged: int | None = 2
+    # After this many seconds since the last clue
+    interval_sec: float | None = 5.0
+    # Once every guesser has guessed since the last clue
+    all_guessers: bool = True
+    # Generate the next clue speculatively while waiting for the cue
+    prefetch: bool = True
+
+
 class Cluer(Player[ClueEvent], ABC):
     """
     Player that gives clues to help guessers guess the target word.
+
+    Without pacing, clues are generated back-to-back. With a CluePacing policy,
+    each new clue waits for a cue (see CluePacing) before it is published.
+    The next clue is prefetched once the cue is one event away, so it already
+    reflects nearly everything the pacing waited for. It is regenerated only
+    if more than one verdict arrived after it started.
     """
-    def __init__(self):
+    role = "cluer"
+
+    def __init__(self, pacing: CluePacing | None = None):
         super().__init__()
+        self.pacing = pacing
+        self.cues: Counter[str] = Counter()
+        # Prefetched clues dropped because several verdicts arrived after they started
+        self.discarded_prefetches = 0
 
     async def next_clue(self) -> str:
         raise NotImplementedError
 
     async def play(self):
+        prefetched: asyncio.Task[str] | None = None
         while not self.game.is_over():
-            clue = await self.next_clue()
+            try:
+                clue = await (prefetched if prefetched else self.next_clue())
+            except asyncio.CancelledError:
+                return
+            except CallSkipped as e:
+                prefetched = None
+                await self.back_off(e.retry_after)
+                continue
             await self.announce(ClueEvent(role="cluer", clue=clue))
+            if self.pacing is None:
+                continue
+            cue, prefetched, started = await self._wait_for_cue(len(self.game.events))
+            if cue:
+                self.cues[cue] += 1
+            if prefetched is not None and self._stale(started):
+                # Written before the verdicts the pacing waited for: regenerate
+                prefetched.cancel()
+                if prefetched.done() and not prefetched.cancelled():
+                    prefetched.exception()  # a failed prefetch is dropped, not reported as unhandled
+                prefetched = None
+                self.discarded_prefetches += 1
+
+    def _stale(self, start: int) -> bool:
+        """Whether more than one verdict arrived since offset ``start`` (the prefetch may miss only the cue's own)."""
+        return sum(1 for ev in self.game.events[start:] if ev.role == "judge") > 1
+
+    def _cue_is_near(self, judged: int, responded: set[str], guessers: set[str]) -> bool:
+        """Whether one more event would fire a cue (always true for interval-only pacing)."""
+        assert self.pacing is not None
+        event_cues = False
+        if self.pacing.after_judged is not None:
+            event_cues = True
+            if judged >= self.pacing.after_judged - 1:
+                return True
+        if self.pacing.all_guessers and guessers:
+            event_cues = True
+            if len(guessers - responded) <= 1:
+                return True
+        return not event_cues
+
+    async def _wait_for_cue(self, start: int) -> tuple[str | None, asyncio.Task[str] | None, int]:
+        """Wait until the pacing policy allows the next clue.
+
+        Returns the cue that fired (if any), the prefetched next clue (if one was
+        started) and the event offset at which the prefetch started.
+        """
+        assert self.pacing is not None
+        loop = asyncio.get_running_loop()
+        interval = self.pacing.interval_sec
+        deadline = loop.time() + interval if interval is not None else None
+        guessers = {p.player_id for p in self.game.players if isinstance(p, Guesser)}
+        responded: set[str] = set()
+        judged = 0
+        idx = start
+        prefetched: asyncio.Task[str] | None = None
+        prefetched_at = start
+        while not self.game.is_over():
+            if self.pacing.prefetch and prefetched is None and self._cue_is_near(judged, responded, guessers):
+                prefetched, prefetched_at = self.spawn(self.next_clue()), idx
+            timeout = None if deadline is None else deadline - loop.time()
+            if timeout is not None and timeout <= 0:
+                return "interval", prefetched, prefetched_at
+            try:
+                n = await asyncio.wait_for(self.game.wait_next(idx), timeout)
+            except asyncio.TimeoutError:
+                return "interval", prefetched, prefetched_at
+            for ev in self.game.events[idx:n]:
+                if ev.role == "judge":
+                    judged += 1
+                elif ev.role == "guesser":
+                    responded.add(ev.player_id)
+            idx = n
+            if self.pacing.after_judged is not None and judged >= self.pacing.after_judged:
+                return "judged", prefetched, prefetched_at
+            if self.pacing.all_guessers and guessers and responded >= guessers:
+                return "all_guessers", prefetched, prefetched_at
+        return None, prefetched, prefetched_at
 
 class Buzzer(Player[BuzzEvent], ABC):
     """
     Player that buzzes if a clue violates the taboo words.
     """
+    role = "buzzer"
+
     async def _violates(self, text: str) -> str | None:
         raise NotImplementedError
     
@@ -106,7 +268,12 @@ class Buzzer(Player[BuzzEvent], ABC):
                 if ev.role == "cluer":
                     clue = ev.clue
                     # only buzz on violation
-                    reason = await self._violates(clue)
+                    try:
+                        reason = await self._violates(clue)
+                    except CallSkipped as e:
+                        # Fail open: a missed buzz is cheaper than a stalled round
+                        log.warning(f"Buzzer: skipped check of {clue!r}: {e}")
+                        continue
                     if reason:
                         await self.announce(BuzzEvent(role="buzzer", clue=clue, violates_taboo=True, reason=reason))
 
@@ -118,10 +285,21 @@ class Guess(BaseModel):
 class Guesser(Player[GuessEvent], ABC):
     """
     Player that makes guesses about the target word.
+
+    With duplicate_policy="suppress", guesses that repeat an already-judged
+    wrong guess (after normalizing case, punctuation and articles) are dropped
+    instead of published.
     """
-    def __init__(self, player_id: str):
+    role = "guesser"
+
+    def __init__(self, player_id: str, duplicate_policy: Literal["publish", "suppress"] = "publish"):
         super().__init__()
         self.player_id = player_id
+        self.duplicate_policy = duplicate_policy
+
+    @property
+    def budget_id(self) -> str:
+        return self.player_id
 
     async def next_guess(self) -> Guess:
         raise NotImplementedError
@@ -136,10 +314,21 @@ class Guesser(Player[GuessEvent], ABC):
                     return
 
         while not self.game.is_over():
-            guess = await self.next_guess()
+            try:
+                guess = await self.next_guess()
+            except BudgetThrottled:
+                # Budget is low: back off until something else happens in the round
+                await self.back_off()
+                continue
+            except CallSkipped as e:
+                await self.back_off(e.retry_after)
+                continue
             # Skip empty guesses
             if not guess.guess or not guess.guess.strip():
                 continue
+            if self.duplicate_policy == "suppress" and self.game.guess_index.lookup(guess.guess) is False:
+                self.game.guess_index.suppressed += 1
+                continue
             await self.announce(GuessEvent(role="guesser", player_id=self.player_id, guess=guess.guess, rationale=guess.rationale))
 
 
@@ -147,6 +336,8 @@ class Judge(Player[JudgeEvent], ABC):
     """
     Player that judges whether guesses are correct.
     """
+    role = "judge"
+
     async def check_guess(self, guess: str) -> bool:
         raise NotImplementedError
 
@@ -158,7 +349,18 @@ class Judge(Player[JudgeEvent], ABC):
             idx = n
             for ev in events:
                 if ev.role == "guesser":
-                    is_correct = await self.check_guess(ev.guess)
+                    # Exact repeats of an already-judged guess are answered from the index;
+                    # stem-only matches (e.g. plurals) still need a verdict
+                    known = self.game.guess_index.lookup(ev.guess)
+                    if known is None and (similar := self.game.guess_index.hint(ev.guess)):
+                        log.debug(f"Judge: {ev.guess!r} resembles earlier guess {similar!r}")
+                    try:
+                        is_correct = known if known is not None else await self.check_guess(ev.guess)
+                    except CallSkipped as e:
+                        # Left unjudged; the guess can be judged if it is made again
+                        log.warning(f"Judge: skipped {ev.guess!r}: {e}")
+                        continue
+                    self.game.guess_index.record(ev.guess, is_correct, duplicate=known is not None)
                     await self.announce(JudgeEvent(role="judge", guess=ev.guess, is_correct=is_correct, by=getattr(ev, "player_id", None)))
                     if is_correct:
                         return
@@ -0,0 +1,139 @@
+"""
+Multi-round sessions that keep the same players across rounds.
+
+A Session plays consecutive rounds with one set of players, so agents, their
+pooled LM clients, hedgers, breakers and verdict caches stay warm. Scores
+are tallied across rounds. The next card is prepared while the current round
+plays and tears down: a deck is read directly, and a card generator runs in
+a worker thread. Each round reports its gap, the time from the previous
+round's end event to this round's start.
+"""
+
+from __future__ import annotations
+import asyncio
+import logging
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from pydantic import BaseModel
+
+from .agents.card_creator import TabooCard
+from .event_log import EventLog
+from .game import Game
+from .player import Cluer, Guesser, Player
+
+
+log = logging.getLogger(__name__)
+
+
+class RoundResult(BaseModel):
+    round: int
+    target: str
+    reason: str
+    winner: Optional[str] = None
+    # Round time, from start to the end event
+    duration_sec: float
+    # From the end event until every round task finished (or the teardown deadline)
+    teardown_sec: float
+    # From the previous round's end event to this round's start (None for the first round)
+    gap_sec: Optional[float] = None
+
+
+class Session:
+    def __init__(
+        self,
+        players: List[Player],
+        cards: Iterable[TabooCard] | Callable[[], TabooCard],
+        duration_sec: int = 120,
+        budget_tokens: int | None = None,
+        event_log: Callable[[], EventLog] | None = None,
+    ):
+        self.players = players
+        self.duration_sec = duration_sec
+        self.budget_tokens = budget_tokens
+        # Factory for each round's EventLog (e.g. a bounded one)
+        self.event_log = event_log
+        if callable(cards):
+            self._generate: Callable[[], TabooCard] | None = cards
+            self._deck: Iterator[TabooCard] | None = None
+        else:
+            self._generate = None
+            self._deck = iter(cards)
+        self.scores: Counter[str] = Counter()
+        self.results: List[RoundResult] = []
+        self._last_end: float | None = None
+
+    async def _next_card(self) -> TabooCard | None:
+        if self._generate is not None:
+            # Card generation is a blocking LLM call; keep it off the loop
+            return await asyncio.to_thread(self._generate)
+        assert self._deck is not None
+        return next(self._deck, None)
+
+    def _score(self, result: RoundResult):
+        for p in self.players:
+            if isinstance(p, (Cluer, Guesser)):
+                self.scores.setdefault(p.budget_id, 0)
+        if result.reason == "correct":
+            # The winning guesser and the cluer both score
+            if result.winner:
+                self.scores[result.winner] += 1
+            self.scores["cluer"] += 1
+
+    async def run(self, rounds: int | None = None) -> List[RoundResult]:
+        """Play up to ``rounds`` rounds (or until the deck runs out); returns this run's results."""
+        played: List[RoundResult] = []
+        if rounds is not None and rounds < 1:
+            return played
+        upcoming: asyncio.Task[TabooCard | None] | None = asyncio.create_task(self._next_card())
+        try:
+            while upcoming is not None:
+                card = await upcoming
+                upcoming = None
+                if card is None:
+                    break
+                # Prepare the following card while this round plays and tears down,
+                # unless this is the last requested round (no card is drawn and discarded)
+                if rounds is None or len(played) + 1 < rounds:
+                    upcoming = asyncio.create_task(self._next_card())
+                played.append(await self._play(card))
+        finally:
+            if upcoming is not None:
+                upcoming.cancel()
+        return played
+
+    async def _play(self, card: TabooCard) -> RoundResult:
+        loop = asyncio.get_running_loop()
+        game = Game(
+            target=card.target, taboo_words=card.taboo_words, players=self.players, duration_sec=self.duration_sec,
+            budget_tokens=self.budget_tokens, event_log=self.event_log() if self.event_log else None,
+        )
+        start = loop.time()
+        outcome = await game.play()
+        end = outcome["events"][-1]
+        ended_at = game.ended_at if game.ended_at is not None else loop.time()
+        result = RoundResult(
+            round=len(self.results) + 1,
+            target=card.target,
+            reason=end.reason or "unknown",
+            winner=end.winner,
+            duration_sec=ended_at - start,
+            teardown_sec=outcome["teardown"]["sec"],
+            gap_sec=None if self._last_end is None else start - self._last_end,
+        )
+        self._last_end = ended_at
+        self._score(result)
+        self.results.append(result)
+        log.info(f"Session: round {result.round} {card.target!r} ended ({result.reason}), gap {result.gap_sec}")
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        gaps = [r.gap_sec for r in self.results if r.gap_sec is not None]
+        return {
+            "rounds": len(self.results),
+            "solved": sum(1 for r in self.results if r.reason == "correct"),
+            "scores": dict(self.scores.most_common()),
+            "mean_gap_sec": sum(gaps) / len(gaps) if gaps else 0.0,
+            "max_gap_sec": max(gaps, default=0.0),
+            "mean_teardown_sec": sum(r.teardown_sec for r in self.results) / len(self.results) if self.results else 0.0,
+        }
@@ -0,0 +1,68 @@
+"""
+Virtual-clock event loop for simulated rounds.
+
+``VirtualClockLoop`` is a regular selector event loop whose ``time()`` is
+virtual. Whenever every task is idle waiting on a timer, the clock jumps
+straight to the next scheduled timer instead of sleeping, so ``asyncio.sleep``,
+``wait_for`` timeouts and ``Game``'s round timer cost no wall-clock time.
+Real I/O is still polled on every iteration, but rounds should be driven by
+fake players (see ``taboo.fake``): a network call would look idle and let the
+clock run ahead of it.
+"""
+
+from __future__ import annotations
+import asyncio
+import functools
+import selectors
+from typing import Any, Callable, Coroutine, TypeVar
+
+
+T = TypeVar("T")
+
+
+class _VirtualSelector(selectors.DefaultSelector):  # type: ignore[misc, valid-type]
+    def __init__(self, loop: 'VirtualClockLoop'):
+        super().__init__()
+        self._loop = loop
+
+    def select(self, timeout: float | None = None):
+        # Nothing scheduled at all: block on real I/O (e.g. call_soon_threadsafe) like a normal loop
+        if timeout is None:
+            return super().select(None)
+        events = super().select(0)
+        if not events and timeout > 0:
+            self._loop.advance(timeout)
+        return events
+
+
+class VirtualClockLoop(asyncio.SelectorEventLoop):
+    def __init__(self, start: float = 0.0):
+        self._virtual_time = start
+        super().__init__(selector=_VirtualSelector(self))
+
+    def time(self) -> float:
+        return self._virtual_time
+
+    def advance(self, seconds: float) -> None:
+        """Move the virtual clock forward (the loop does this by itself when idle)."""
+        self._virtual_time += seconds
+
+
+def run_simulated(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion on a fresh virtual-clock loop."""
+    loop = VirtualClockLoop()
+    try:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(coro)
+    finally:
+        asyncio.set_event_loop(None)
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+
+def simulated(fn: Callable[..., Coroutine[Any, Any, T]]) -> Callable[..., T]:
+    """Decorator that runs an async function (e.g. a test) on simulated time."""
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        return run_simulated(fn(*args, **kwargs))
+    return wrapper
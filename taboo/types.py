@@ -35,6 +35,14 @@ class GuessEvent(BaseEvent):
     rationale: Optional[str] = None
 
 
+class RationaleEvent(BaseEvent):
+    """Rationale for an already-published guess, attached once the LLM finishes it."""
+    role: Literal["rationale"]
+    player_id: str
+    guess: str
+    rationale: str
+
+
 class JudgeEvent(BaseEvent):
     role: Literal["judge"]
     guess: str
@@ -44,10 +52,10 @@ class JudgeEvent(BaseEvent):
 
 class SystemMessage(BaseEvent):
     role: Literal["system"]
-    event: Literal["timeout", "end"]
-    reason: Optional[Literal["correct", "timeout", "buzzed"]] = None
+    event: Literal["timeout", "budget", "end"]
+    reason: Optional[Literal["correct", "timeout", "buzzed", "budget"]] = None
     winner: Optional[str] = None
 
 
-Event = Annotated[Union[ClueEvent, BuzzEvent, GuessEvent, JudgeEvent, SystemMessage], Field(discriminator="role")]
+Event = Annotated[Union[ClueEvent, BuzzEvent, GuessEvent, RationaleEvent, JudgeEvent, SystemMessage], Field(discriminator="role")]
 HistoryList = List[Event]
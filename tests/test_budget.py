@@ -0,0 +1,76 @@
+import asyncio
+import pytest
+
+from taboo.budget import BudgetExceeded, BudgetThrottled, RoundBudget
+from taboo.game import Game
+from taboo.player import Buzzer, Cluer, Guess, Guesser, Judge
+
+
+def test_budget_records_spend_per_agent():
+    budget = RoundBudget(max_tokens=None)
+    with budget.charge("cluer") as charge:
+        charge.tokens = 120
+    budget.charge("g1").settle(30)
+    assert budget.stats()["per_agent"] == {"cluer": {"tokens": 120, "calls": 1}, "g1": {"tokens": 30, "calls": 1}}
+    assert budget.reserved == 0
+    assert not budget.exhausted.is_set()
+
+
+def test_low_priority_is_throttled_first():
+    budget = RoundBudget(max_tokens=1_000, estimate_tokens=100, low_water=0.5)
+    budget.charge("cluer").settle(450)
+    with pytest.raises(BudgetThrottled):
+        budget.charge("g2", priority="low")
+    # High-priority work still gets through
+    budget.charge("judge").settle(550)
+    assert budget.exhausted.is_set()
+    with pytest.raises(BudgetExceeded):
+        budget.charge("judge")
+    assert budget.stats()["throttled"] == {"g2": 1}
+
+
+class MeteredCluer(Cluer):
+    async def next_clue(self) -> str:
+        with self.charge() as charge:
+            await asyncio.sleep(0.01)
+            charge.tokens = 100
+        return "red fruit"
+
+
+class QuietBuzzer(Buzzer):
+    async def _violates(self, text: str) -> str | None:
+        return None
+
+
+class MeteredGuesser(Guesser):
+    async def next_guess(self) -> Guess:
+        with self.charge() as charge:
+            await asyncio.sleep(0.01)
+            charge.tokens = 50
+        return Guess(guess=f"{self.player_id}-{len(self.game.events)}")
+
+
+class WrongJudge(Judge):
+    async def check_guess(self, guess: str) -> bool:
+        return False
+
+
+@pytest.mark.asyncio
+async def test_round_ends_when_budget_is_spent():
+    guessers = [MeteredGuesser("g1"), MeteredGuesser("g2"), MeteredGuesser("g3")]
+    game = Game(
+        target="apple", taboo_words=[],
+        players=[MeteredCluer(), QuietBuzzer(), WrongJudge(), *guessers],
+        duration_sec=5, budget_tokens=5_000,
+    )
+
+    result = await asyncio.wait_for(game.play(), timeout=5)
+
+    end = result["events"][-1]
+    assert end.event == "end" and end.reason == "budget"
+    spend = result["spend"]
+    assert spend["spent"] >= 5_000
+    assert set(spend["per_agent"]) == {"cluer", "g1", "g2", "g3"}
+    assert guessers[0].budget_priority == "high"
+    assert [g.budget_priority for g in guessers[1:]] == ["low", "low"]
+    assert set(spend["throttled"]) <= {"g2", "g3"}
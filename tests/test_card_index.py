@@ -0,0 +1,74 @@
+import random
+import string
+from types import SimpleNamespace
+
+import pytest
+
+from taboo.agents import card_creator
+from taboo.agents.card_creator import DuplicateCardError, TabooCard
+from taboo.card_index import CardIndex
+
+
+APPLE = ("apple", ["fruit", "red", "pie", "tree", "juice"])
+
+
+def _random_word(rng: random.Random) -> str:
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(5, 9)))
+
+
+def test_near_duplicates_are_found():
+    index = CardIndex()
+    index.add(*APPLE)
+    index.add("banana", ["yellow", "monkey", "peel", "split", "tropical"])
+
+    assert index.query("Apples", ["orchard", "cider", "core", "seed", "green"]) == [("apple", 1.0)]
+    [(target, score)] = index.query("apple pie", ["fruits", "red", "pie", "trees", "juice"])
+    assert target == "apple" and score >= index.threshold
+    assert index.query("guitar", ["strings", "music", "band", "acoustic", "pick"]) == []
+
+
+def test_add_if_new_rejects_duplicates():
+    index = CardIndex()
+    assert index.add_if_new(*APPLE) == []
+    assert index.add_if_new("the apple", APPLE[1])
+    assert len(index) == 1
+    assert index.stats()["rejected"] == 1
+
+
+def test_lookup_stays_sublinear_across_merges():
+    rng = random.Random(0)
+    index = CardIndex(merge_every=64)
+    cards = [(_random_word(rng), [_random_word(rng) for _ in range(5)]) for _ in range(5_000)]
+    for target, taboo in cards:
+        index.add(target, taboo)
+
+    # Cards indexed before and after the last merge are still found
+    for target, taboo in cards[:5] + cards[-5:]:
+        assert (target, 1.0) in index.query(target.upper(), taboo)
+    stats = index.stats()
+    assert stats["candidates_per_lookup"] < 5
+    assert stats["index_bytes"] < 300 * len(cards)
+
+
+def test_generate_regenerates_duplicates(monkeypatch):
+    index = CardIndex()
+    index.add(*APPLE)
+    calls = []
+    replies = iter([APPLE, ("apples", APPLE[1]), ("harbor", ["boat", "dock", "port", "ship", "water"])])
+
+    def fake_create_card(avoid_targets):
+        calls.append(list(avoid_targets))
+        target, taboo = next(replies)
+        return SimpleNamespace(target=target, taboo_words=taboo)
+
+    monkeypatch.setattr(card_creator, "create_card", fake_create_card)
+
+    card = TabooCard.generate(index=index)
+
+    assert card.target == "harbor"
+    assert calls[0] == ["apple"] and "apples" in calls[2]
+    assert len(index) == 2 and index.stats()["rejected"] == 2
+
+    monkeypatch.setattr(card_creator, "create_card", lambda avoid_targets: SimpleNamespace(target="apple", taboo_words=APPLE[1]))
+    with pytest.raises(DuplicateCardError):
+        TabooCard.generate(index=index, max_attempts=2)
@@ -0,0 +1,58 @@
+import dspy
+import pytest
+from unittest.mock import AsyncMock
+
+from taboo.agents import AIGuesser
+from taboo.agents.cascade import Cascade, CascadePolicy
+from taboo.guess_index import GuessIndex
+from taboo.llm.registry import get_lm
+from taboo.types import JudgeEvent
+
+
+class FakeGame:
+    def __init__(self, wrong: int = 0, remaining: float = 10.0):
+        self.events = [JudgeEvent(role="judge", guess=f"w{i}", is_correct=False) for i in range(wrong)]
+        self.remaining = remaining
+        self.guess_index = GuessIndex()
+
+    def history(self):
+        return list(self.events)
+
+    def remaining_sec(self):
+        return self.remaining
+
+
+@pytest.mark.parametrize(
+    "wrong, remaining, threshold, expected",
+    [
+        (0, 10.0, None, "cheap"),
+        (3, 10.0, None, "strong"),
+        (0, 90.0, 60.0, "strong"),
+        (0, 30.0, 60.0, "cheap"),
+    ],
+)
+def test_cascade_escalation_rules(wrong, remaining, threshold, expected):
+    strong = get_lm("gemini/gemini-2.5-flash", temperature=1.0, max_tokens=20_000)
+    cascade = Cascade(CascadePolicy(escalate_after_wrong=3, escalate_when_remaining_sec_above=threshold), strong, "g1")
+    lm = cascade.choose(FakeGame(wrong=wrong, remaining=remaining))
+    assert (lm is strong) == (expected == "strong")
+    assert cascade.stats()[expected] == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("confidence, expected_guess, expected_calls", [(0.9, "pear", 1), (0.2, "apple", 2)])
+async def test_guesser_escalates_on_low_confidence(confidence, expected_guess, expected_calls):
+    guesser = AIGuesser(player_id="g1", cascade=CascadePolicy(min_confidence=0.5))
+    guesser._game = FakeGame()
+
+    async def answer(**kwargs):
+        if kwargs.get("lm", dspy.settings.lm) is guesser.lm:
+            return AsyncMock(guess="apple", rationale="strong", confidence=0.95)
+        return AsyncMock(guess="pear", rationale="cheap", confidence=confidence)
+
+    guesser.guess_fn.aforward = AsyncMock(side_effect=answer)
+    guess = await guesser.next_guess()
+
+    assert guess.guess == expected_guess
+    assert guesser.guess_fn.aforward.await_count == expected_calls
+    assert guesser.cascade.stats() == {"cheap": 1, "strong": expected_calls - 1}
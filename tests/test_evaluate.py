@@ -0,0 +1,102 @@
+import json
+import math
+
+import pytest
+
+from typer.testing import CliRunner
+
+from taboo.agents.card_creator import TabooCard
+from taboo.cli import app
+from taboo.evaluate import CardResult, EvalConfig, evaluate, format_table, load_deck, pacing_report, summarize
+
+
+CARDS = [
+    {"target": "apple", "taboo_words": ["fruit", "red"]},
+    {"target": "river", "taboo_words": ["water", "flow"]},
+    {"target": "zebra", "taboo_words": ["stripes", "horse"]},
+]
+
+
+def test_load_deck_reads_json_array_and_lines(tmp_path):
+    array = tmp_path / "deck.json"
+    array.write_text(json.dumps(CARDS))
+    lines = tmp_path / "deck.jsonl"
+    lines.write_text("\n".join(json.dumps(c) for c in CARDS) + "\n")
+
+    assert load_deck(array) == load_deck(lines) == [TabooCard(**c) for c in CARDS]
+
+
+def test_fake_evaluation_runs_offline_in_deck_order():
+    deck = [TabooCard(**c) for c in CARDS] * 4
+    config = EvalConfig(fake=True, seed=1, duration_sec=30)
+
+    results = evaluate(config, deck, parallel=3)
+
+    assert [r.target for r in results] == [c.target for c in deck]
+    # Fake guessers never say "zebra"
+    assert not any(r.solved for r in results if r.target == "zebra")
+    assert all(r.reason == "timeout" and r.elapsed_sec >= 30 for r in results if r.target == "zebra")
+    assert all(r.llm_calls > 0 and r.tokens > 0 for r in results)
+    assert evaluate(config, deck, parallel=3) == results
+
+
+def test_summary_and_diff_table():
+    def result(solved: bool, elapsed: float, clues: int = 2) -> CardResult:
+        return CardResult(target="t", reason="correct" if solved else "timeout", solved=solved, elapsed_sec=elapsed,
+                          clues=clues, guesses=2 * clues, llm_calls=10, tokens=500 * clues)
+
+    a = summarize([result(True, 4.0), result(False, 60.0, clues=6)])
+    b = summarize([result(True, 2.0), result(True, 6.0)])
+    assert a["solve_rate"] == 0.5 and a["time_to_solve_sec"] == 4.0
+    # Per-solve metrics cover solved cards only; per-card ones include the failures
+    assert a["clues_per_solve"] == 2.0 and a["guesses_per_solve"] == 4.0 and a["tokens_per_solve"] == 1_000
+    assert a["tokens_per_card"] == 2_000
+    assert b["tokens_per_solve"] == 1_000
+    assert math.isnan(summarize([result(False, 60.0)])["time_to_solve_sec"])
+
+    table = format_table({"a": a, "b": b}).splitlines()
+    assert table[0].split() == ["metric", "a", "b", "delta"]
+    assert table[4].split() == ["solve_rate", "50.0%", "100.0%", "+50.0%"]
+
+
+def test_eval_command_compares_two_configs(tmp_path):
+    deck = tmp_path / "deck.jsonl"
+    deck.write_text("\n".join(json.dumps(c) for c in CARDS))
+    base = tmp_path / "base.json"
+    base.write_text(EvalConfig(name="base", duration_sec=20).model_dump_json())
+    more = tmp_path / "more.json"
+    more.write_text(EvalConfig(name="more", guessers=6, duration_sec=20).model_dump_json())
+    out = tmp_path / "results.jsonl"
+
+    res = CliRunner().invoke(app, ["eval", str(deck), "--config", str(base), "--config", str(more),
+                                   "--fake", "--seed", "3", "--out", str(out)])
+
+    assert res.exit_code == 0, res.output
+    assert "delta" in res.output and "solve_rate" in res.output
+    rows = [json.loads(line) for line in out.read_text().splitlines()]
+    assert [r["config"] for r in rows] == ["base"] * 3 + ["more"] * 3
+
+
+def test_fake_mode_rejects_settings_it_cannot_model(tmp_path):
+    deck = [TabooCard(**c) for c in CARDS]
+    with pytest.raises(ValueError, match="hedge, stream"):
+        evaluate(EvalConfig(fake=True, hedge=True, stream=True), deck)
+
+    path = tmp_path / "deck.jsonl"
+    path.write_text("\n".join(json.dumps(c) for c in CARDS))
+    pro = tmp_path / "pro.json"
+    pro.write_text(EvalConfig(name="pro", guesser_model="gemini/gemini-2.5-pro").model_dump_json())
+    res = CliRunner().invoke(app, ["eval", str(path), "--config", str(pro), "--fake"])
+    assert res.exit_code != 0 and "guesser_model" in res.output
+
+
+def test_pacing_report_compares_clues_and_tokens_per_correct_answer():
+    deck = [TabooCard(**c) for c in CARDS[:2]] * 3
+    report = pacing_report(EvalConfig(fake=True, seed=2, duration_sec=30), deck, parallel=3)
+
+    assert list(report) == ["unpaced", "default", "judged", "interval"]
+    assert all(r["cards"] == 6 and r["solved"] > 0 for r in report.values())
+    # Pacing cuts the clue flood
+    assert report["default"]["clues_per_round"] < report["unpaced"]["clues_per_round"]
+    assert report["default"]["tokens_per_correct"] < report["unpaced"]["tokens_per_correct"]
+    assert "tokens_per_correct" in format_table(report)
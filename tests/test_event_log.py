@@ -0,0 +1,118 @@
+import asyncio
+import gc
+
+import pytest
+
+from taboo.agents.cascade import Cascade, CascadePolicy
+from taboo.event_log import EventLog
+from taboo.fake import fake_players
+from taboo.game import Game
+from taboo.llm.registry import get_lm
+from taboo.simclock import simulated
+from taboo.types import ClueEvent, GuessEvent, JudgeEvent
+
+
+def _events(n: int) -> list:
+    return [
+        ClueEvent(role="cluer", clue=f"clue {i}") if i % 3 == 0 else GuessEvent(role="guesser", player_id="g1", guess=f"guess {i}")
+        for i in range(n)
+    ]
+
+
+def test_offsets_stay_valid_after_archival(tmp_path):
+    events = _events(260)
+    log = EventLog(segment_size=50, hot_segments=2, archive_dir=tmp_path)
+    for ev in events:
+        log.append(ev)
+
+    assert len(log) == 260
+    assert log.first_resident == 200
+    assert log.resident() == events[200:]
+    assert log[0] == events[0] and log[-1] == events[-1]
+    assert log[45:55] == events[45:55]
+    assert list(log) == events and list(reversed(log)) == events[::-1]
+    assert len(list(tmp_path.glob("segment-*.jsonl"))) == 4
+
+    stats = log.stats()
+    assert stats["resident_events"] == 60 and stats["archived_events"] == 200
+    assert stats["archived_segments"] == 4
+    assert 0 < stats["resident_bytes"] < stats["archived_bytes"]
+    with pytest.raises(IndexError):
+        log[260]
+
+
+def test_unbounded_log_never_archives():
+    log = EventLog(segment_size=10)
+    for ev in _events(100):
+        log.append(ev)
+    assert log.stats()["archived_events"] == 0
+    assert log.resident() == list(log)
+
+
+def test_temporary_archive_is_removed_with_the_log():
+    log = EventLog(segment_size=5, hot_segments=1)
+    for ev in _events(20):
+        log.append(ev)
+    archive = log._archive_dir
+    assert archive is not None and archive.exists()
+    del log
+    gc.collect()
+    assert not archive.exists()
+
+
+@simulated
+async def test_long_round_keeps_a_bounded_hot_window(tmp_path):
+    log = EventLog(segment_size=100, hot_segments=2, archive_dir=tmp_path)
+    game = Game(target="zebra", taboo_words=[], players=fake_players(guessers=5, seed=2), duration_sec=120, event_log=log)
+
+    result = await game.play()
+
+    stats = result["memory"]
+    assert stats["archived_events"] > 0
+    assert stats["resident_events"] <= 200
+    assert len(game.hot_history()) == stats["resident_events"]
+    # A late subscriber replays the round from offset 0, through the archive
+    replay = []
+    async for ev in game.stream(start=0):
+        replay.append(ev)
+        if len(replay) == len(log):
+            break
+    assert replay[-1].role == "system" and replay[-1].event == "end"
+    assert sum(1 for e in replay if e.role == "judge") == result["guesses"]["judged"]
+    # The round result covers the archived events too
+    assert isinstance(result["events"], list)
+    assert result["events"] == game.history() == replay
+    assert len(replay) > len(game.hot_history())
+    assert result["guess_events"] == sum(1 for e in replay if e.role == "guesser")
+
+
+@pytest.mark.asyncio
+async def test_flush_writes_segments_off_the_loop(tmp_path, mocker):
+    events = _events(30)
+    log = EventLog(segment_size=10, hot_segments=1, archive_dir=tmp_path)
+    to_thread = mocker.spy(asyncio, "to_thread")
+    for ev in events:
+        log.append(ev, archive=False)
+    # Nothing is written until flush(); overflowing segments stay readable in memory
+    assert log.stats()["archived_segments"] == 0 and log[0] == events[0]
+
+    await asyncio.gather(log.flush(), log.flush())
+
+    assert to_thread.call_count == 2
+    assert log.first_resident == 20 and len(list(tmp_path.glob("segment-*.jsonl"))) == 2
+    assert list(log) == events
+
+
+@simulated
+async def test_history_includes_archived_events(tmp_path):
+    game = Game(target="apple", taboo_words=[], players=fake_players(guessers=1, seed=0),
+                event_log=EventLog(segment_size=2, hot_segments=1, archive_dir=tmp_path))
+    for guess in ["pear", "plum", "fig", "kiwi"]:
+        await game.publish(JudgeEvent(role="judge", guess=guess, is_correct=False))
+
+    assert len(game.hot_history()) == 2
+    assert [e.guess for e in game.history()] == ["pear", "plum", "fig", "kiwi"]
+    # Archived verdicts still count toward escalation
+    strong = get_lm("gemini/gemini-2.5-flash", temperature=1.0, max_tokens=20_000)
+    cascade = Cascade(CascadePolicy(escalate_after_wrong=3), strong, "g1")
+    assert cascade.choose(game) is strong
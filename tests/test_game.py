@@ -3,6 +3,7 @@ import pytest
 
 from taboo.game import Game
 from taboo.player import Cluer, Guesser, Buzzer, Judge, Guess
+from taboo.simclock import simulated
 
 
 class SimpleCluer(Cluer):
@@ -98,3 +99,71 @@ async def test_game_end_conditions(mocker, scenario, players_kwargs, expected_re
 
     assert getattr(end_event, "reason", None) == expected_reason
 
+
+
+class HangingBuzzer(Buzzer):
+    async def _violates(self, text: str) -> str | None:
+        # A tracked provider call that never returns
+        return await self.run(asyncio.sleep(3600))
+
+
+class StubbornJudge(SimpleJudge):
+    async def check_guess(self, guess: str) -> bool:
+        async def ignores_cancellation():
+            while True:
+                try:
+                    await asyncio.sleep(3600)
+                except asyncio.CancelledError:
+                    continue
+
+        self.spawn(ignores_cancellation())
+        return True
+
+
+@simulated
+async def test_teardown_cancels_tracked_work_immediately():
+    game = Game(target="apple", taboo_words=[], duration_sec=5,
+                players=[SimpleCluer(), HangingBuzzer(), SimpleJudge(correct=True), SimpleGuesser(guess="apple")])
+    result = await game.play()
+    assert result["events"][-1].reason == "correct"
+    assert result["teardown"] == {"sec": 0.0, "stragglers": 0}
+
+
+@simulated
+async def test_teardown_deadline_bounds_stubborn_work():
+    loop = asyncio.get_running_loop()
+    game = Game(target="apple", taboo_words=[], duration_sec=5, teardown_timeout_sec=0.5,
+                players=[SimpleCluer(), SimpleBuzzer(), StubbornJudge(), SimpleGuesser(guess="apple")])
+    seen_end: list[float] = []
+
+    async def watch():
+        async for ev in game.stream():
+            if ev.role == "system" and ev.event == "end":
+                seen_end.append(loop.time())
+                return
+
+    watcher = asyncio.create_task(watch())
+    result = await game.play()
+    await watcher
+
+    # Subscribers see the end event before teardown starts; teardown stops at the deadline
+    assert seen_end == [game.ended_at]
+    assert result["teardown"] == {"sec": 0.5, "stragglers": 1}
+    assert loop.time() - game.ended_at == pytest.approx(0.5)
+
+
+@simulated
+async def test_teardown_includes_flushing_the_end_event():
+    game = Game(target="apple", taboo_words=[], duration_sec=5,
+                players=[SimpleCluer(), SimpleBuzzer(), SimpleJudge(correct=True), SimpleGuesser(guess="apple")])
+    flush = game.events.flush
+
+    async def slow_flush():
+        ev = game.events[-1]
+        if ev.role == "system" and ev.event == "end":
+            await asyncio.sleep(0.25)
+        await flush()
+
+    game.events.flush = slow_flush
+    result = await game.play()
+    assert result["teardown"] == {"sec": 0.25, "stragglers": 0}
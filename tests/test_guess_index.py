@@ -0,0 +1,119 @@
+import asyncio
+import pytest
+
+from taboo.game import Game
+from taboo.guess_index import GuessIndex, guess_key, normalize_guess
+from taboo.player import Buzzer, Cluer, Guess, Guesser, Judge
+
+
+@pytest.mark.parametrize(
+    "a, b",
+    [
+        ("Apple", "apple"),
+        ("  the Apple! ", "apple"),
+        ("apples", "apple"),
+        ("berries", "berry"),
+        ("boxes", "box"),
+        ("running", "runn"),
+    ],
+)
+def test_near_duplicates_share_a_key(a, b):
+    assert guess_key(a) == guess_key(b)
+
+
+@pytest.mark.parametrize("a, b", [("cat", "bat"), ("glass", "glas"), ("bus", "bu"), ("ring", "r")])
+def test_distinct_words_keep_distinct_keys(a, b):
+    assert guess_key(a) != guess_key(b)
+
+
+def test_index_tracks_rejected_and_duplicates():
+    index = GuessIndex()
+    assert index.lookup("Pear") is None
+    index.record("Pear", False)
+    index.record("the pear!", False, duplicate=True)
+    index.suppressed += 1
+    assert index.lookup("PEAR!") is False
+    # A stem-only match is a hint, not a verdict
+    assert index.lookup("pears") is None and index.hint("pears") == "pear"
+    index.record("pears", False)
+    assert index.rejected() == [normalize_guess("Pear")]
+    assert index.stats() == {"judged": 3, "duplicates": 1, "near_duplicates": 1, "suppressed": 1, "duplicate_rate": 2 / 4}
+
+
+@pytest.mark.parametrize("earlier, guess", [("morn", "morning"), ("even", "evening"), ("new", "news"), ("len", "lens")])
+def test_stem_collisions_are_not_answered_from_the_index(earlier, guess):
+    index = GuessIndex()
+    index.record(earlier, False)
+    assert guess_key(earlier) == guess_key(guess)
+    assert index.lookup(guess) is None
+    assert index.hint(guess) == earlier
+
+
+class OneClueCluer(Cluer):
+    def __init__(self):
+        super().__init__()
+        self.sent = False
+
+    async def next_clue(self) -> str:
+        await asyncio.sleep(0)
+        if self.sent:
+            await asyncio.sleep(3600)
+        self.sent = True
+        return "red fruit"
+
+
+class QuietBuzzer(Buzzer):
+    async def _violates(self, text: str) -> str | None:
+        return None
+
+
+class ScriptedGuesser(Guesser):
+    def __init__(self, player_id: str, guesses: list[str], **kwargs):
+        super().__init__(player_id, **kwargs)
+        self.guesses = list(guesses)
+
+    async def next_guess(self) -> Guess:
+        await asyncio.sleep(0.01)
+        if not self.guesses:
+            await asyncio.sleep(3600)
+        return Guess(guess=self.guesses.pop(0))
+
+
+class CountingJudge(Judge):
+    def __init__(self, correct: str = "apple"):
+        super().__init__()
+        self.correct = correct
+        self.checked: list[str] = []
+
+    async def check_guess(self, guess: str) -> bool:
+        self.checked.append(guess)
+        return guess == self.correct
+
+
+@pytest.mark.parametrize("policy, expected_judged, expected_suppressed", [("publish", 4, 0), ("suppress", 3, 1)])
+@pytest.mark.asyncio
+async def test_repeats_skip_the_judge(policy, expected_judged, expected_suppressed):
+    judge = CountingJudge()
+    guesser = ScriptedGuesser("g1", ["pear", "Pear", "pears", "apple"], duplicate_policy=policy)
+    game = Game(target="apple", taboo_words=[], players=[OneClueCluer(), QuietBuzzer(), judge, guesser], duration_sec=2)
+
+    result = await asyncio.wait_for(game.play(), timeout=2)
+
+    # "pears" only shares a stem with "pear", so it is judged rather than answered from the index
+    assert judge.checked == ["pear", "pears", "apple"]
+    assert result["guesses"]["judged"] == expected_judged
+    assert result["guesses"]["suppressed"] == expected_suppressed
+    assert result["guesses"]["duplicate_rate"] == 0.25
+
+
+@pytest.mark.asyncio
+async def test_stem_collision_reaches_the_judge():
+    judge = CountingJudge(correct="morning")
+    guesser = ScriptedGuesser("g1", ["morn", "morning"], duplicate_policy="suppress")
+    game = Game(target="morning", taboo_words=[], players=[OneClueCluer(), QuietBuzzer(), judge, guesser], duration_sec=2)
+
+    result = await asyncio.wait_for(game.play(), timeout=2)
+
+    assert judge.checked == ["morn", "morning"]
+    end = result["events"][-1]
+    assert end.reason == "correct" and end.winner == "g1"
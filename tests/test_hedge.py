@@ -0,0 +1,151 @@
+import asyncio
+import statistics
+
+import pytest
+
+from taboo.agents.buzzer import AIBuzzer
+from taboo.agents.judge import AIJudge
+from taboo.llm.fakellm import FakeLLM
+from taboo.llm.hedge import Hedger
+from taboo.simclock import simulated
+
+
+async def _timed_calls(n: int, call) -> list[float]:
+    loop = asyncio.get_running_loop()
+
+    async def one():
+        start = loop.time()
+        await call()
+        return loop.time() - start
+
+    return list(await asyncio.gather(*(one() for _ in range(n))))
+
+
+def _p90(latencies: list[float]) -> float:
+    return statistics.quantiles(latencies, n=10)[-1]
+
+
+@simulated
+async def test_hedging_cuts_long_tail_latency():
+    fake = FakeLLM("judge", tail_prob=0.2, tail_latency=(0.4, 0.5), seed=7)
+    unhedged = await _timed_calls(40, lambda: fake.judge("apple", "pear"))
+
+    fake = FakeLLM("judge", tail_prob=0.2, tail_latency=(0.4, 0.5), seed=7)
+    hedger = Hedger(initial_delay_sec=0.05, max_hedge_rate=0.5)
+    hedged = await _timed_calls(40, lambda: hedger.call(lambda: fake.judge("apple", "pear")))
+
+    assert _p90(hedged) < _p90(unhedged)
+    stats = hedger.stats()
+    assert stats["hedges"] > 0
+    assert stats["hedge_wins"] > 0
+    assert stats["hedges"] <= 0.5 * stats["calls"]
+
+
+@simulated
+async def test_hedge_rate_is_capped():
+    hedger = Hedger(initial_delay_sec=0.01, max_hedge_rate=0.0)
+
+    async def slow():
+        await asyncio.sleep(0.03)
+        return "ok"
+
+    assert await hedger.call(slow) == "ok"
+    assert hedger.stats()["hedges"] == 0
+    assert hedger.stats()["capped"] == 1
+
+
+@simulated
+async def test_cap_holds_from_the_first_call():
+    hedger = Hedger(initial_delay_sec=0.01, max_hedge_rate=0.1)
+
+    async def slow():
+        await asyncio.sleep(0.03)
+        return "ok"
+
+    for _ in range(9):
+        assert await hedger.call(slow) == "ok"
+    assert hedger.stats()["hedges"] == 0 and hedger.stats()["capped"] == 9
+    await hedger.call(slow)
+    assert hedger.stats()["hedges"] == 1
+
+
+@simulated
+async def test_loser_is_cancelled_and_errors_fall_through():
+    hedger = Hedger(initial_delay_sec=0.01, max_hedge_rate=1.0)
+    attempts: list[asyncio.Task] = []
+
+    async def first_hangs_then_fast():
+        attempts.append(asyncio.current_task())
+        if len(attempts) == 1:
+            await asyncio.sleep(3600)
+        return "hedge"
+
+    assert await hedger.call(first_hangs_then_fast) == "hedge"
+    assert attempts[0].cancelled()
+
+    async def fails():
+        raise RuntimeError("provider error")
+
+    with pytest.raises(RuntimeError):
+        await hedger.call(fails)
+
+
+def test_delay_tracks_running_quantile():
+    hedger = Hedger(quantile=0.9, min_samples=10, initial_delay_sec=1.0, min_delay_sec=0.0)
+    assert hedger.delay() == 1.0
+    hedger._latencies.extend([0.1] * 9 + [2.0])
+    assert hedger.delay() == 2.0
+    hedger._latencies.extend([0.1] * 10)
+    assert hedger.delay() == 0.1
+
+
+@simulated
+async def test_latency_is_timed_from_the_request_not_the_winning_hedge():
+    hedger = Hedger(initial_delay_sec=0.1, max_hedge_rate=1.0)
+    calls = 0
+
+    async def slow_primary():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(10.0 if calls == 1 else 0.05)
+        return "ok"
+
+    assert await hedger.call(slow_primary) == "ok"
+    # The hedge took 0.05s, but the request waited 0.1s before it was issued
+    assert list(hedger._latencies) == [pytest.approx(0.15)]
+
+
+class _Game:
+    target = "apple"
+    taboo_words = ["fruit"]
+
+
+def _first_call_hangs(result):
+    calls = []
+
+    async def aforward(**kwargs):
+        calls.append(kwargs)
+        if len(calls) == 1:
+            await asyncio.sleep(3600)
+        return result
+
+    return aforward, calls
+
+
+@simulated
+async def test_judge_and_buzzer_hedge_slow_calls(mocker):
+    judge = AIJudge(hedger=Hedger(initial_delay_sec=0.1, max_hedge_rate=1.0))
+    aforward, judge_calls = _first_call_hangs(mocker.Mock(is_correct=True))
+    mocker.patch.object(judge.checker, "aforward", side_effect=aforward)
+    judge._game = _Game()  # type: ignore[assignment]
+
+    buzzer = AIBuzzer(hedger=Hedger(initial_delay_sec=0.1, max_hedge_rate=1.0))
+    aforward, buzz_calls = _first_call_hangs(mocker.Mock(buzz=True, justification="taboo word"))
+    mocker.patch.object(buzzer.buzz_clue, "aforward", side_effect=aforward)
+    buzzer._game = _Game()  # type: ignore[assignment]
+
+    assert await judge.check_guess("apple") is True
+    assert await buzzer._violates("fruits") == "taboo word"
+    for hedger, calls in ((judge.hedger, judge_calls), (buzzer.hedger, buzz_calls)):
+        assert len(calls) == 2
+        assert hedger.stats()["hedges"] == 1 and hedger.stats()["hedge_wins"] == 1
@@ -0,0 +1,94 @@
+import asyncio
+import random
+
+import pytest
+
+from taboo.game import Game
+from taboo.human import HumanCluer, HumanGuesser, InputQueue
+from taboo.player import Buzzer, Judge
+from taboo.simclock import simulated
+
+
+@simulated
+async def test_rapid_fire_keeps_the_latest_and_drops_repeats():
+    q: InputQueue[str] = InputQueue(maxsize=2, rate_per_sec=1.0, burst=1)
+    for text in ["pear", "pear", "plum", "fig", "kiwi", "kiwi"]:
+        q.put(text)
+
+    assert [await q.get(), await q.get()] == ["pear", "kiwi"]
+    assert q.stats() == {"submitted": 6, "released": 2, "dropped": 2, "coalesced": 2, "throttled": 1, "pending": 0}
+    # The last released item is still a repeat
+    assert q.put("kiwi") is False
+
+
+@simulated
+async def test_repeats_are_matched_like_the_guess_index():
+    human = HumanGuesser("h1")
+    assert human.submit("Apple") is True
+    assert human.submit("apple") is False
+    assert human.submit("  the APPLE! ") is False
+    assert (await human.next_guess()).guess == "Apple"
+    assert human.submit("an apple") is False
+    assert human.submit("apples") is True
+    assert human.inputs.stats()["dropped"] == 3
+
+    cluer = HumanCluer()
+    assert cluer.submit("Red fruit") is True and cluer.submit("red fruit!") is False
+
+
+@simulated
+async def test_releases_follow_the_token_bucket():
+    q: InputQueue[int] = InputQueue(maxsize=10, rate_per_sec=2.0, burst=3)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    for i in range(7):
+        q.put(i)
+
+    released = [(await q.get(), loop.time() - start) for _ in range(7)]
+
+    assert [i for i, _ in released] == list(range(7))
+    assert [t for _, t in released] == pytest.approx([0, 0, 0, 0.5, 1.0, 1.5, 2.0])
+
+
+class NeverBuzz(Buzzer):
+    async def _violates(self, text: str) -> str | None:
+        return None
+
+
+class ExactJudge(Judge):
+    async def check_guess(self, guess: str) -> bool:
+        return guess == self.game.target
+
+
+@simulated
+async def test_thousands_of_human_submissions_stay_bounded():
+    rng = random.Random(0)
+    words = ["apple", "pear", "plum", "fig", "kiwi", "lime", "date", "peach"]
+    cluer = HumanCluer()
+    humans = [HumanGuesser(f"h{i}") for i in range(50)]
+    game = Game(target="zebra", taboo_words=[], players=[cluer, NeverBuzz(), ExactJudge(), *humans], duration_sec=10)
+
+    async def spam(human: HumanGuesser):
+        for _ in range(100):
+            human.submit(rng.choice(words))
+            await asyncio.sleep(rng.expovariate(20.0))
+
+    async def clue():
+        for _ in range(200):
+            cluer.submit(rng.choice(["sweet", "fruit", "sweet"]))
+            await asyncio.sleep(0.01)
+
+    play = asyncio.create_task(game.play())
+    await asyncio.gather(clue(), *(spam(h) for h in humans))
+    result = await play
+
+    stats = [h.inputs.stats() for h in humans]
+    submitted = sum(s["submitted"] for s in stats)
+    released = sum(s["released"] for s in stats)
+    assert submitted == 5_000
+    assert submitted == released + sum(s["dropped"] + s["coalesced"] + s["pending"] for s in stats)
+    assert sum(s["dropped"] for s in stats) > 0 and sum(s["coalesced"] for s in stats) > 0
+    # Each human is released at most burst + rate * duration guesses
+    assert all(s["released"] <= 3 + 10 for s in stats)
+    assert result["guesses"]["judged"] <= released < submitted // 5
+    assert sum(1 for e in game.events if e.role == "cluer") <= 3 + 10
@@ -13,3 +13,16 @@ async def test_check_guess(mocker, guess, target, expected):
     judge._game = AsyncMock(target=target)
     result = await judge.check_guess(guess)
     assert result == expected
+
+
+@pytest.mark.asyncio
+async def test_verdict_cache_is_per_target(mocker):
+    judge = AIJudge()
+    mocker.patch.object(judge.checker, "aforward", side_effect=[AsyncMock(is_correct=True), AsyncMock(is_correct=False)])
+    judge._game = AsyncMock(target="apple")
+    assert await judge.check_guess("apple") is True
+    assert await judge.check_guess("apple") is True
+    # A reused judge must not carry last round's verdicts over to a new target
+    judge._game = AsyncMock(target="pear")
+    assert await judge.check_guess("apple") is False
+    assert judge.checker.aforward.call_count == 2
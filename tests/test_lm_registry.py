@@ -0,0 +1,63 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import dspy
+import pytest
+
+from taboo.agents import AIGuesser
+from taboo.llm.registry import clear_registry, get_lm, lm_stats
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry():
+    clear_registry()
+    yield
+    clear_registry()
+
+
+def test_same_configuration_shares_one_client():
+    guessers = [AIGuesser(player_id=f"g{i}") for i in range(20)]
+    assert len({id(g.lm) for g in guessers}) == 1
+    assert guessers[0].lm.stats.acquired == 20
+
+
+def test_different_configurations_get_different_clients():
+    a = get_lm("gemini/gemini-2.5-flash", temperature=1.0, max_tokens=20_000)
+    b = get_lm("gemini/gemini-2.5-flash", temperature=1.0, max_tokens=2_000)
+    c = get_lm("gemini/gemini-2.5-flash", temperature=1.0, max_tokens=20_000, cache=False)
+    assert len({id(a), id(b), id(c)}) == 3
+    assert len(lm_stats()) == 3
+
+
+def test_get_lm_is_thread_safe():
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        clients = list(pool.map(lambda _: get_lm("gemini/gemini-2.5-flash-lite"), range(64)))
+    assert len({id(c) for c in clients}) == 1
+    assert clients[0].stats.acquired == 64
+
+
+@pytest.mark.asyncio
+async def test_counters_track_calls_tokens_and_errors(mocker):
+    lm = get_lm("gemini/gemini-2.5-flash-lite")
+
+    async def fake_aforward(self, prompt=None, messages=None, **kwargs):
+        await asyncio.sleep(0)
+        if prompt == "boom":
+            raise RuntimeError("provider error")
+        return SimpleNamespace(usage={"prompt_tokens": 10, "completion_tokens": 3}, cache_hit=prompt == "cached")
+
+    mocker.patch.object(dspy.LM, "aforward", fake_aforward)
+
+    await asyncio.gather(lm.aforward(prompt="a"), lm.aforward(prompt="b"), lm.aforward(prompt="cached"))
+    with pytest.raises(RuntimeError):
+        await lm.aforward(prompt="boom")
+
+    stats = lm.stats.snapshot()
+    assert stats["calls"] == 4
+    assert stats["errors"] == 1
+    assert stats["cache_hits"] == 1
+    assert stats["prompt_tokens"] == 20
+    assert stats["completion_tokens"] == 6
+    assert stats["in_flight"] == 0
+    assert stats["peak_in_flight"] == 3
@@ -0,0 +1,146 @@
+import asyncio
+
+from taboo.game import Game
+from taboo.player import Buzzer, Cluer, CluePacing, Guess, Guesser, Judge
+from taboo.simclock import simulated
+
+
+class CountingCluer(Cluer):
+    def __init__(self, pacing=None, latency: float = 0.01):
+        super().__init__(pacing=pacing)
+        self.latency = latency
+        self.generated = 0
+
+    async def next_clue(self) -> str:
+        await asyncio.sleep(self.latency)
+        self.generated += 1
+        return f"clue {self.generated}"
+
+
+class QuietBuzzer(Buzzer):
+    async def _violates(self, text: str) -> str | None:
+        return None
+
+
+class SlowGuesser(Guesser):
+    async def next_guess(self) -> Guess:
+        await asyncio.sleep(0.1)
+        return Guess(guess=f"{self.player_id}-{len(self.game.events)}")
+
+
+class WrongJudge(Judge):
+    async def check_guess(self, guess: str) -> bool:
+        return False
+
+
+async def _run(cluer: Cluer, duration: float = 0.5) -> dict:
+    players = [cluer, QuietBuzzer(), WrongJudge(), SlowGuesser("g1"), SlowGuesser("g2")]
+    game = Game(target="apple", taboo_words=[], players=players, duration_sec=duration)  # type: ignore[arg-type]
+    return await asyncio.wait_for(game.play(), timeout=5)
+
+
+@simulated
+async def test_pacing_reduces_clue_flood():
+    unpaced = await _run(CountingCluer())
+    paced_cluer = CountingCluer(pacing=CluePacing(after_judged=2, interval_sec=None, all_guessers=False))
+    paced = await _run(paced_cluer)
+
+    assert paced["clues"] < unpaced["clues"] / 3
+    assert paced["clues"] >= 2
+    assert set(paced_cluer.cues) == {"judged"}
+
+
+@simulated
+async def test_interval_cue_fires_without_guesses():
+    cluer = CountingCluer(pacing=CluePacing(after_judged=None, interval_sec=0.05, all_guessers=False))
+    game = Game(
+        target="apple", taboo_words=[],
+        players=[cluer, QuietBuzzer(), WrongJudge(), SlowGuesser("g1")],
+        duration_sec=0.3,
+    )
+    game.players[3].next_guess = lambda: asyncio.sleep(3600)  # type: ignore[method-assign]
+    result = await asyncio.wait_for(game.play(), timeout=5)
+    assert 3 <= result["clues"] <= 7
+    assert set(cluer.cues) == {"interval"}
+
+
+@simulated
+async def test_prefetch_hides_generation_latency():
+    # One guesser, so verdicts arrive 0.1s apart and the prefetch starts one verdict before the cue
+    pacing = CluePacing(after_judged=2, interval_sec=None, all_guessers=False)
+
+    async def delays(prefetch: bool) -> tuple[list[float], CountingCluer]:
+        cluer = CountingCluer(pacing=pacing.model_copy(update={"prefetch": prefetch}), latency=0.08)
+        game = Game(target="apple", taboo_words=[], players=[cluer, QuietBuzzer(), WrongJudge(), SlowGuesser("g1")],
+                    duration_sec=1.0)
+        loop = asyncio.get_running_loop()
+        stamped: list[tuple[str, float]] = []
+        publish = game.publish
+
+        async def timed_publish(ev):
+            stamped.append((ev.role, loop.time()))
+            await publish(ev)
+
+        game.publish = timed_publish  # type: ignore[method-assign]
+        await asyncio.wait_for(game.play(), timeout=5)
+        # From each cue (the verdict right before a clue) to the clue itself
+        cue_to_clue = []
+        last_verdict = None
+        for role, t in stamped:
+            if role == "judge":
+                last_verdict = t
+            elif role == "cluer" and last_verdict is not None:
+                cue_to_clue.append(t - last_verdict)
+                last_verdict = None
+        return cue_to_clue, cluer
+
+    with_prefetch, cluer = await delays(True)
+    without_prefetch, _ = await delays(False)
+    assert with_prefetch and max(with_prefetch) < 0.01
+    assert min(without_prefetch) >= 0.08
+    assert cluer.discarded_prefetches < sum(cluer.cues.values())
+
+
+@simulated
+async def test_default_pacing_keeps_most_prefetches():
+    cluer = CountingCluer(pacing=CluePacing(), latency=0.08)
+    await _run(cluer, duration=2.0)
+    cues = sum(cluer.cues.values())
+    assert cues >= 5
+    assert cluer.discarded_prefetches < cues
+    # Prefetching adds at most the discarded generations (plus one in flight at the end)
+    assert cluer.generated <= 1 + cues + cluer.discarded_prefetches + 1
+
+
+class HistoryCluer(Cluer):
+    def __init__(self, pacing: CluePacing):
+        super().__init__(pacing=pacing)
+        self.seen: list[list[str]] = []
+
+    async def next_clue(self) -> str:
+        self.seen.append([e.guess for e in self.game.history() if e.role == "judge"])
+        await asyncio.sleep(0.05)
+        return f"clue {len(self.seen)}"
+
+
+class TwoWrongGuesser(Guesser):
+    async def next_guess(self) -> Guess:
+        made = sum(1 for e in self.game.events if e.role == "guesser")
+        if made >= 2:
+            await asyncio.sleep(3600)
+        await asyncio.sleep(0.2)
+        return Guess(guess=["pear", "plum"][made])
+
+
+@simulated
+async def test_stale_prefetch_is_regenerated():
+    # Interval-only pacing prefetches right away; two verdicts arrive before the interval ends
+    cluer = HistoryCluer(CluePacing(after_judged=None, interval_sec=1.0, all_guessers=False))
+    game = Game(target="apple", taboo_words=[], players=[cluer, QuietBuzzer(), WrongJudge(), TwoWrongGuesser("g1")],
+                duration_sec=1.5)
+    await asyncio.wait_for(game.play(), timeout=5)
+
+    published = [e.clue for e in game.events if e.role == "cluer"]
+    assert cluer.seen[:3] == [[], [], ["pear", "plum"]]
+    assert published[:2] == ["clue 1", "clue 3"]
+    assert cluer.discarded_prefetches == 1
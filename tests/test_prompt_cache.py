@@ -0,0 +1,112 @@
+import dspy
+import pytest
+from dspy.adapters import ChatAdapter
+from litellm import ModelResponse
+
+from taboo.agents import AICluer
+from taboo.agents.buzzer import BuzzClue
+from taboo.agents.cluer import GenerateClue
+from taboo.agents.guesser import GuessWord, GuessWordWithConfidence
+from taboo.agents.judge import CheckGuess
+from taboo.llm.prompt_cache import PromptPrefixCache, declared_static_inputs, prompt_cache, static_inputs
+from taboo.llm.registry import clear_registry
+from taboo.types import ClueEvent, GuessEvent, JudgeEvent
+
+
+HISTORY = [
+    ClueEvent(role="cluer", clue="red fruit"),
+    GuessEvent(role="guesser", player_id="g1", guess="cherry"),
+    JudgeEvent(role="judge", guess="cherry", is_correct=False),
+]
+
+CALLS = [
+    (GenerateClue, dict(target="apple", taboo_words=["fruit", "red"], history=HISTORY)),
+    (GuessWord, dict(player_id="g1", player_personality="sarcastic", rejected_guesses=["cherry"], history=HISTORY)),
+    (GuessWordWithConfidence, dict(player_id="g2", player_personality=None, rejected_guesses=[], history=[])),
+    (CheckGuess, dict(target="apple", guess="apples")),
+    (BuzzClue, dict(taboo_words=["fruit", "red"], clue="fruits")),
+]
+
+
+@pytest.mark.parametrize("signature,inputs", CALLS)
+def test_prompts_match_chat_adapter(signature, inputs):
+    adapter = PromptPrefixCache()
+    expected = ChatAdapter().format(signature, demos=[], inputs=inputs)
+    assert adapter.format(signature, demos=[], inputs=inputs) == expected
+    # Served from the cached prefix the second time
+    assert adapter.format(signature, demos=[], inputs=inputs) == expected
+    assert adapter.stats()[signature.__name__]["hits"] == 1
+
+
+def test_agent_signatures_declare_their_static_inputs():
+    assert {sig: declared_static_inputs(sig) for sig, _ in CALLS} == {
+        GenerateClue: ("target", "taboo_words"),
+        GuessWord: ("player_id", "player_personality"),
+        GuessWordWithConfidence: ("player_id", "player_personality"),
+        CheckGuess: ("target",),
+        BuzzClue: ("taboo_words",),
+    }
+
+
+def test_new_fields_are_per_call_unless_declared():
+    previous = dspy.InputField(description="Clues given so far")
+    inputs = dict(target="apple", taboo_words=["fruit"], history=[], previous_clues=["red"])
+    adapter = PromptPrefixCache()
+
+    # An undeclared signature only reuses its system message
+    extended = GenerateClue.append("previous_clues", previous, type_=list[str])
+    assert declared_static_inputs(extended) == ()
+    assert adapter.format(extended, demos=[], inputs=inputs) == ChatAdapter().format(extended, demos=[], inputs=inputs)
+    changed = adapter.format(extended, demos=[], inputs={**inputs, "previous_clues": ["red", "tree"]})
+    assert "tree" in changed[1]["content"]
+
+    # A declaration must name the leading input fields
+    declared = static_inputs("target", "taboo_words")(GenerateClue.append("previous_clues", previous, type_=list[str]))
+    assert adapter.format(declared, demos=[], inputs=inputs) == ChatAdapter().format(declared, demos=[], inputs=inputs)
+    with pytest.raises(ValueError, match="leading input fields"):
+        static_inputs("target", "taboo_words")(GenerateClue.prepend("previous_clues", previous, type_=list[str]))
+
+
+def test_static_prefix_is_stable_as_history_grows():
+    adapter = PromptPrefixCache()
+    prompts = [
+        adapter.format(GenerateClue, demos=[], inputs=dict(target="apple", taboo_words=["fruit", "red"], history=HISTORY[:n]))
+        for n in range(len(HISTORY) + 1)
+    ]
+
+    systems = {p[0]["content"] for p in prompts}
+    assert len(systems) == 1
+    prefix = prompts[0][1]["content"].split("[[ ## history ## ]]")[0]
+    assert all(p[1]["content"].startswith(prefix) for p in prompts)
+    assert "[[ ## taboo_words ## ]]" in prefix
+
+    stats = adapter.stats()["GenerateClue"]
+    assert stats["calls"] == 4 and stats["hits"] == 3
+    assert 0.5 < stats["cacheable_prefix_ratio"] < 1.0
+    # A new card renders a new prefix
+    adapter.format(GenerateClue, demos=[], inputs=dict(target="river", taboo_words=["water"], history=[]))
+    assert adapter.stats()["GenerateClue"]["hits"] == 3
+
+
+@pytest.mark.asyncio
+async def test_agents_render_through_the_shared_cache(mocker):
+    sent = []
+
+    async def acompletion(**kwargs):
+        sent.append(kwargs["messages"])
+        return ModelResponse(model="fake", choices=[{"message": {"role": "assistant", "content": "[[ ## clue ## ]]\norchard\n\n[[ ## completed ## ]]"}}])
+
+    clear_registry()
+    prompt_cache().clear()
+    mocker.patch("litellm.acompletion", side_effect=acompletion)
+    cluer = AICluer(model="gemini/fake")
+    cluer.lm = dspy.LM("gemini/fake", cache=False)
+    cluer._game = mocker.Mock(target="apple", taboo_words=["fruit", "red"], history=lambda: list(HISTORY[:len(sent)]))
+
+    assert await cluer.next_clue() == "orchard"
+    assert await cluer.next_clue() == "orchard"
+
+    assert sent[0][0] == sent[1][0]
+    assert sent[1][1]["content"].startswith(sent[0][1]["content"].split("[[ ## history ## ]]")[0])
+    assert prompt_cache().stats()["GenerateClue"]["hits"] == 1
+    clear_registry()
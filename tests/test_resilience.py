@@ -0,0 +1,99 @@
+import asyncio
+
+import pytest
+
+from taboo.fake import fake_players
+from taboo.game import Game
+from taboo.llm.fakellm import FakeLLM
+from taboo.llm.resilience import CallSkipped, Resilience
+from taboo.simclock import simulated
+
+
+@simulated
+async def test_transient_errors_are_retried():
+    fake = FakeLLM("judge", seed=3, fail_prob=0.3)
+    resilience = Resilience(failure_threshold=100, seed=3)
+    answers = []
+    for _ in range(20):
+        try:
+            answers.append(await resilience.call(lambda _: fake.judge("apple", "apple"), "judge"))
+        except CallSkipped:
+            pass
+
+    stats = resilience.stats()
+    assert stats["error"] > 0 and stats["retried"] > 0
+    assert stats["ok"] == len(answers) > stats["skipped"]
+    assert stats["ok"] + stats["skipped"] == 20
+    assert fake.calls == stats["ok"] + stats["error"]
+
+
+@simulated
+async def test_deadline_comes_from_remaining_round_time():
+    fake = FakeLLM("judge", hang_prob=1.0)
+    resilience = Resilience(max_call_sec=30.0, min_call_sec=0.5)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    with pytest.raises(CallSkipped):
+        await resilience.call(lambda _: fake.judge("apple", "pear"), "judge", remaining_sec=2.0)
+
+    # The hung call is cut at the round's end and no retry is started that could not land in time
+    assert loop.time() - start == pytest.approx(2.0)
+    assert fake.calls == 1
+    assert resilience.stats()["timeout"] == 1
+    assert resilience.stats()["out_of_time"] == 1
+
+
+@simulated
+async def test_breaker_fails_fast_to_fallback_then_probes():
+    llms = {"primary": FakeLLM("primary", fail_prob=1.0), "backup": FakeLLM("backup")}
+    resilience = Resilience(failure_threshold=3, reset_after_sec=10.0, fallbacks={"primary": "backup"}, seed=0)
+
+    def judge(model: str):
+        return llms[model].judge("apple", "apple")
+
+    assert await resilience.call(judge, "primary") is True
+    assert llms["primary"].calls == 3
+    assert resilience.stats()["breakers"]["primary"]["open"]
+
+    # Open breaker: straight to the fallback without touching the primary
+    assert await resilience.call(judge, "primary") is True
+    assert llms["primary"].calls == 3
+    assert resilience.stats()["short_circuit"] == 1
+    assert resilience.stats()["fallback"] == 2
+
+    # After the reset interval a single probe goes to the primary; it fails and reopens the breaker
+    await asyncio.sleep(10.0)
+    assert await resilience.call(judge, "primary") is True
+    assert llms["primary"].calls == 4
+    assert resilience.stats()["breakers"]["primary"] == {"open": True, "failures": 4, "opened": 1}
+
+
+@simulated
+async def test_skip_when_every_breaker_is_open():
+    fake = FakeLLM("judge", fail_prob=1.0)
+    resilience = Resilience(max_attempts=2, failure_threshold=2, reset_after_sec=5.0, seed=0)
+
+    with pytest.raises(CallSkipped):
+        await resilience.call(lambda _: fake.judge("apple", "pear"), "judge")
+    with pytest.raises(CallSkipped) as skipped:
+        await resilience.call(lambda _: fake.judge("apple", "pear"), "judge")
+
+    assert fake.calls == 2
+    assert 0 < skipped.value.retry_after <= 5.0
+    assert resilience.stats()["skipped"] == 2
+
+
+@simulated
+async def test_round_survives_flaky_provider():
+    resilience = Resilience(max_call_sec=5.0, seed=5)
+    players = fake_players(guessers=3, seed=5, fail_prob=0.2, hang_prob=0.05, resilience=resilience)
+    # Nobody guesses "zebra", so every agent keeps calling for the full round
+    game = Game(target="zebra", taboo_words=["stripes"], players=players, duration_sec=60)
+
+    result = await game.play()
+
+    assert result["events"][-1].reason == "timeout"
+    assert result["guesses"]["judged"] > 20
+    stats = resilience.stats()
+    assert stats["ok"] > 0 and stats["error"] > 0 and stats["timeout"] > 0
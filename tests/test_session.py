@@ -0,0 +1,94 @@
+import asyncio
+import time
+
+import pytest
+
+from taboo.agents.card_creator import TabooCard
+from taboo.fake import fake_players
+from taboo.player import Buzzer, Cluer, Guess, Guesser, Judge
+from taboo.session import Session
+from taboo.simclock import simulated
+
+
+DECK = [TabooCard(target=t, taboo_words=["thing"]) for t in ["apple", "river", "zebra", "coffee", "table"]]
+
+
+@simulated
+async def test_session_reuses_players_and_tracks_scores():
+    players = fake_players(guessers=3, seed=4)
+    session = Session(players, DECK, duration_sec=30)
+
+    results = await session.run()
+
+    assert [r.target for r in results] == [c.target for c in DECK]
+    assert all(p.game.target == "table" for p in players)
+    stats = session.stats()
+    solved = sum(1 for r in results if r.reason == "correct")
+    assert stats["solved"] == solved == stats["scores"]["cluer"]
+    assert sum(v for k, v in stats["scores"].items() if k != "cluer") == solved
+    assert set(stats["scores"]) == {"cluer", "g1", "g2", "g3"}
+    assert results[0].gap_sec is None
+    assert stats["max_gap_sec"] < 0.01
+
+
+@simulated
+async def test_run_stops_after_requested_rounds():
+    session = Session(fake_players(guessers=2, seed=1), DECK, duration_sec=30)
+    assert [r.target for r in await session.run(rounds=2)] == ["apple", "river"]
+    second = await session.run(rounds=2)
+    # No card is drawn past the last requested round, so the next run picks up where this one stopped
+    assert [r.target for r in second] == ["zebra", "coffee"]
+    assert [r.round for r in second] == [3, 4]
+
+
+@simulated
+async def test_generator_is_called_once_per_played_round():
+    calls = []
+
+    def generate() -> TabooCard:
+        calls.append(DECK[len(calls)])
+        return calls[-1]
+
+    session = Session(fake_players(guessers=2, seed=1), generate, duration_sec=30)
+    await session.run(rounds=2)
+    await session.run(rounds=1)
+    assert [r.target for r in session.results] == ["apple", "river", "zebra"]
+    assert len(calls) == 3
+
+
+class QuickCluer(Cluer):
+    async def next_clue(self) -> str:
+        await asyncio.sleep(0.05)
+        return "a clue"
+
+
+class NeverBuzz(Buzzer):
+    async def _violates(self, text: str) -> str | None:
+        return None
+
+
+class SlowSolver(Guesser):
+    async def next_guess(self) -> Guess:
+        await asyncio.sleep(0.3)
+        return Guess(guess=self.game.target)
+
+
+class ExactJudge(Judge):
+    async def check_guess(self, guess: str) -> bool:
+        return guess == self.game.target
+
+
+@pytest.mark.asyncio
+async def test_card_generation_overlaps_the_round():
+    generated = iter(DECK)
+
+    def generate() -> TabooCard:
+        time.sleep(0.2)  # a blocking generation call
+        return next(generated)
+
+    session = Session([QuickCluer(), NeverBuzz(), ExactJudge(), SlowSolver("g1")], generate, duration_sec=5)
+    results = await session.run(rounds=3)
+
+    assert [r.reason for r in results] == ["correct"] * 3
+    # The next card was generated while the previous round played, not after it
+    assert all(r.gap_sec is not None and r.gap_sec < 0.1 for r in results[1:])
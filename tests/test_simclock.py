@@ -0,0 +1,58 @@
+import asyncio
+import time
+
+from taboo.fake import fake_players
+from taboo.game import Game
+from taboo.simclock import VirtualClockLoop, run_simulated
+
+
+def _round(target: str, seed: int, duration: int = 60) -> dict:
+    game = Game(target=target, taboo_words=["fruit", "red"], players=fake_players(guessers=3, seed=seed), duration_sec=duration)
+    return run_simulated(game.play())
+
+
+def test_virtual_clock_jumps_to_next_timer():
+    async def sleepy():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await asyncio.sleep(3600)
+        return loop.time() - start
+
+    wall = time.perf_counter()
+    assert run_simulated(sleepy()) == 3600
+    assert time.perf_counter() - wall < 1
+
+
+def test_full_length_round_runs_faster_than_real_time():
+    wall = time.perf_counter()
+    result = _round("zebra", seed=1)
+    assert time.perf_counter() - wall < 5
+    end = result["events"][-1]
+    assert end.event == "end" and end.reason == "timeout"
+    assert result["guesses"]["judged"] > 50
+
+
+def test_simulated_rounds_are_reproducible():
+    def transcript(seed: int) -> list[dict]:
+        return [e.model_dump() for e in _round("apple", seed=seed)["events"]]
+
+    assert transcript(3) == transcript(3)
+    assert transcript(3) != transcript(4)
+
+
+def test_many_rounds_in_seconds():
+    wall = time.perf_counter()
+    reasons = [_round("apple", seed=s)["events"][-1].reason for s in range(100)]
+    assert time.perf_counter() - wall < 20
+    assert set(reasons) <= {"correct", "timeout"}
+    assert reasons.count("correct") > 50
+
+
+def test_loop_clock_is_virtual():
+    loop = VirtualClockLoop(start=10.0)
+    try:
+        assert loop.time() == 10.0
+        loop.advance(5)
+        assert loop.time() == 15.0
+    finally:
+        loop.close()
@@ -0,0 +1,89 @@
+import asyncio
+
+import dspy
+import pytest
+from litellm import ModelResponseStream
+from litellm.types.utils import Delta, StreamingChoices
+
+from taboo.agents import AIGuesser
+from taboo.agents.guesser import GuessWord
+from taboo.guess_index import GuessIndex
+from taboo.llm.registry import clear_registry
+from taboo.llm.streaming import StreamedCall, StreamStats
+from taboo.types import GuessEvent
+
+
+GUESS_STREAM = [
+    "[[ ## guess ## ]]\n", "ap", "ple",
+    "\n\n[[ ## rationale ## ]]\n", "Red, round", " and grows on trees",
+    "\n\n[[ ## completed ## ]]",
+]
+
+
+@pytest.fixture
+def streaming_provider(mocker):
+    async def acompletion(**kwargs):
+        async def chunks():
+            for text in GUESS_STREAM:
+                await asyncio.sleep(0.02)
+                yield ModelResponseStream(model="fake", choices=[StreamingChoices(delta=Delta(content=text))])
+        return chunks()
+
+    clear_registry()
+    mocker.patch("litellm.acompletion", side_effect=acompletion)
+    yield
+    clear_registry()
+
+
+class FakeGame:
+    def __init__(self):
+        self.events = []
+        self.guess_index = GuessIndex()
+
+    async def publish(self, ev):
+        self.events.append(ev)
+
+    def history(self):
+        return list(self.events)
+
+
+@pytest.mark.asyncio
+async def test_field_resolves_before_full_completion(streaming_provider):
+    stats = StreamStats()
+    lm = dspy.LM("gemini/fake", cache=False)
+    with dspy.context(lm=lm):
+        call = StreamedCall(dspy.Predict(GuessWord), "guess", stats=stats, history=[], player_id="g1", player_personality=None)
+        driver = asyncio.create_task(call.drive())
+
+    assert await call.field() == "apple"
+    assert not driver.done()
+
+    prediction = await call.prediction()
+    assert prediction.rationale == "Red, round and grows on trees"
+    await driver
+
+    summary = stats.summary()
+    assert summary["calls"] == 1
+    assert summary["mean_field_ready_sec"] < summary["mean_completion_sec"]
+
+
+@pytest.mark.asyncio
+async def test_streaming_guesser_publishes_rationale_as_update(streaming_provider):
+    guesser = AIGuesser(player_id="g1", model="gemini/fake", stream=True)
+    guesser.lm = dspy.LM("gemini/fake", cache=False)
+    game = FakeGame()
+    guesser.join(game)
+
+    guess = await guesser.next_guess()
+    assert guess.guess == "apple" and guess.rationale is None
+    await guesser.announce(GuessEvent(role="guesser", player_id="g1", guess=guess.guess))
+
+    for _ in range(100):
+        if len(game.events) == 2:
+            break
+        await asyncio.sleep(0.01)
+
+    assert [e.role for e in game.events] == ["guesser", "rationale"]
+    assert game.events[1].guess == "apple"
+    assert game.events[1].rationale == "Red, round and grows on trees"
+    await guesser.end()
@@ -1,7 +1,7 @@
 import pytest
 from pydantic import ValidationError
 
-from taboo.types import ClueEvent, BuzzEvent, GuessEvent, JudgeEvent
+from taboo.types import ClueEvent, BuzzEvent, GuessEvent, RationaleEvent, JudgeEvent
 
 
 @pytest.mark.parametrize(
@@ -10,6 +10,7 @@ from taboo.types import ClueEvent, BuzzEvent, GuessEvent, JudgeEvent
         ({"role": "cluer", "clue": "A hint"}, ClueEvent),
         ({"role": "buzzer", "clue": "A hint", "violates_taboo": True}, BuzzEvent),
         ({"role": "guesser", "player_id": "g1", "guess": "apple"}, GuessEvent),
+        ({"role": "rationale", "player_id": "g1", "guess": "apple", "rationale": "red"}, RationaleEvent),
         ({"role": "judge", "guess": "apple", "is_correct": True}, JudgeEvent),
     ],
 )